@@ -4,10 +4,15 @@ Auto-selects the most recent calendar event when user explicitly requests
 "last meeting" and multiple options exist.
 """
 
+import re
 from typing import Optional, Dict, Any, List
 from app.integrations.google_calendar_client import get_calendar_event_by_id
 
 
+# Recency language: "last", "latest", "most recent", "most-recent" (any case)
+_RECENCY_RE = re.compile(r"\b(?:last|latest|most[-\s]recent)\b", re.IGNORECASE)
+
+
 def resolve_last_meeting(
     message: str,
     intent: str,
@@ -48,11 +53,7 @@ def resolve_last_meeting(
         return None
     
     # Condition 4: Message must contain recency language
-    message_lower = message.lower() if message else ""
-    recency_keywords = ["last", "latest", "most recent", "most-recent"]
-    has_recency_language = any(keyword in message_lower for keyword in recency_keywords)
-    
-    if not has_recency_language:
+    if not message or not _RECENCY_RE.search(message):
         return None
     
     # All conditions met - auto-select the first (most recent) option
@@ -1,7 +1,7 @@
 """Tool execution module - executes tools with structured data."""
 
 import logging
-from typing import Dict, Any, Optional, Tuple
+from typing import Callable, Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
 from app.memory.repo import MemoryRepository
 from app.tools.summarization import SummarizationTool
@@ -9,6 +9,7 @@ from app.tools.meeting_brief import MeetingBriefTool
 from app.tools.followup import FollowUpTool
 from app.orchestrator.integration_data_fetching import IntegrationDataFetcher
 from app.orchestrator.meeting_finder import MeetingFinder
+from app.orchestrator.workflow_planning import VALID_ACTIONS
 from app.orchestrator.delta_processing_service import compute_delta_context
 from app.memory.schemas import MeetingUpdate, DecisionCreate
 from app.utils.date_utils import format_datetime_display
@@ -19,6 +20,35 @@ from datetime import datetime
 logger = logging.getLogger(__name__)
 
 
+# Whitelist of allowed prerequisites (anything else is an LLM hallucination)
+_ALLOWED_PREREQUISITES = frozenset({
+    "meeting_id", "client_id", "user_id", "transcript",
+    "meeting_title", "meeting_date", "calendar_event",
+    "calendar_event_id", "meeting_summary", "structured_data",
+    "client_context", "target_date", "client_name"
+})
+
+# Prerequisites that are PRODUCED BY workflow steps (output prerequisites)
+# These must NOT be validated before workflow execution
+_OUTPUT_PREREQUISITES = frozenset({
+    "meeting_id",  # Produced by find_meeting step
+    "transcript"   # Produced by retrieve_transcript step
+})
+
+# Optional prerequisites: accept if available, but don't block if missing
+_OPTIONAL_PREREQUISITES = frozenset({"meeting_date"})
+
+# Prerequisites that must be satisfied BEFORE workflow execution
+_VALIDATED_PREREQUISITES = (
+    _ALLOWED_PREREQUISITES - _OUTPUT_PREREQUISITES - _OPTIONAL_PREREQUISITES
+)
+
+
+def is_valid_step(step: Any) -> bool:
+    """Return True for a workflow step dict that names both an action and a tool."""
+    return isinstance(step, dict) and bool(step.get("action")) and bool(step.get("tool"))
+
+
 class ToolExecutor:
     """Handles tool execution based on intent with structured data."""
     
@@ -37,6 +67,16 @@ class ToolExecutor:
         self.meeting_brief_tool = meeting_brief_tool
         self.followup_tool = followup_tool
         self.integration_data_fetcher = integration_data_fetcher
+        # Workflow step dispatch table (action -> handler)
+        self._step_handlers = {
+            "find_meeting": self._step_find_meeting,
+            "skip_step": self._step_skip,
+            "retrieve_transcript": self._step_retrieve_transcript,
+            "summarize": self._step_summarize,
+            "generate_followup": self._step_generate_followup,
+            "generate_brief": self._step_generate_brief,
+            "retrieve_calendar_event": self._step_retrieve_calendar_event,
+        }
     
     async def prepare_integration_data(
         self,
@@ -986,68 +1026,17 @@ class ToolExecutor:
         if not isinstance(required_data, list) or not required_data:
             return None  # No prerequisites declared, all satisfied
         
-        # Prerequisites that must exist BEFORE workflow execution (input prerequisites)
-        INPUT_PREREQUISITES = {
-            "client_name",
-            "meeting_date"  # Optional: accept if available, but don't block if missing
-        }
-        
-        # Prerequisites that are PRODUCED BY workflow steps (output prerequisites)
-        # These must NOT be validated before workflow execution
-        OUTPUT_PREREQUISITES = {
-            "meeting_id",  # Produced by find_meeting step
-            "transcript"   # Produced by retrieve_transcript step
-        }
+        # Only string keys can name a prerequisite; anything else is LLM noise
+        declared = {key for key in required_data if isinstance(key, str)}
         
-        # Whitelist of allowed prerequisites
-        ALLOWED_PREREQUISITES = {
-            "meeting_id", "client_id", "user_id", "transcript",
-            "meeting_title", "meeting_date", "calendar_event",
-            "calendar_event_id", "meeting_summary", "structured_data",
-            "client_context", "target_date", "client_name"
-        }
-        
-        missing_prereqs = []
-        
-        for key in required_data:
-            # Skip unknown prerequisites (LLM hallucination)
-            if key not in ALLOWED_PREREQUISITES:
-                # Silently skip unknown keys
-                continue
-            
-            # Skip output prerequisites - these are produced by workflow steps
-            # and should NOT block workflow execution
-            if key in OUTPUT_PREREQUISITES:
-                # Always pass for output prerequisites (workflow will produce them)
-                continue
-            
-            # Only validate input prerequisites before workflow execution
-            if key in INPUT_PREREQUISITES:
-                # For meeting_date, it's optional - don't block if missing
-                if key == "meeting_date":
-                    # Check if available, but don't add to missing if not found
-                    if not self._check_single_prerequisite(
-                        key, context, prepared_data, integration_data,
-                        extracted_info, user_id, client_id
-                    ):
-                        # meeting_date is optional, so don't add to missing_prereqs
-                        pass
-                else:
-                    # For other input prerequisites (e.g., client_name), validate strictly
-                    if not self._check_single_prerequisite(
-                        key, context, prepared_data, integration_data,
-                        extracted_info, user_id, client_id
-                    ):
-                        missing_prereqs.append(key)
-            # For other prerequisites (not in INPUT_PREREQUISITES or OUTPUT_PREREQUISITES),
-            # validate them as before (backward compatibility)
-            elif key not in OUTPUT_PREREQUISITES:
-                # Check prerequisite based on key
-                if not self._check_single_prerequisite(
-                    key, context, prepared_data, integration_data,
-                    extracted_info, user_id, client_id
-                ):
-                    missing_prereqs.append(key)
+        # Unknown, output and optional prerequisites drop out in one intersection
+        missing_prereqs = sorted(
+            key for key in _VALIDATED_PREREQUISITES.intersection(declared)
+            if not self._check_single_prerequisite(
+                key, context, prepared_data, integration_data,
+                extracted_info, user_id, client_id
+            )
+        )
         
         # Return error if any missing
         if missing_prereqs:
@@ -1193,18 +1182,24 @@ class ToolExecutor:
         if not isinstance(steps, list) or not steps:
             return None  # Fall back to legacy routing
         
-        # Filter out invalid steps
-        valid_steps = []
-        for i, step in enumerate(steps):
-            if not isinstance(step, dict):
-                continue  # Skip non-dict steps
-            if not step.get("action") or not step.get("tool"):
-                continue  # Skip steps missing required fields
-            valid_steps.append((i, step))
+        # Filter out invalid steps (non-dict, or missing action/tool)
+        valid_steps = [(i, step) for i, step in enumerate(steps) if is_valid_step(step)]
         
         if not valid_steps:
             return None  # No valid steps, fall back to legacy
         
+        # Fail fast on actions the planner could never produce (and that have no
+        # fallback to recover them), before any earlier step runs its side effects.
+        # Planner-valid actions without a handler still fail only when reached.
+        for step_index, step in valid_steps:
+            action = step.get("action")
+            if action not in VALID_ACTIONS and not step.get("fallback"):
+                return {
+                    "tool_name": "workflow",
+                    "error": f"Unknown action '{action}'",
+                    "step": {"index": step_index, "action": action, "tool": step.get("tool")}
+                }
+        
         # Loop through workflow steps
         for step_index, step in valid_steps:
             action = step.get("action")
@@ -1417,170 +1412,232 @@ class ToolExecutor:
         if not action or not tool:
             return None  # Invalid step, skip
         
-        if action == "find_meeting":
-            # Try database first
-            meeting_finder = MeetingFinder(self.db, self.memory)
-            meeting_id = meeting_finder.find_meeting_in_database(
-                meeting_id=execution_context.get("meeting_id"),
-                client_id=client_id,
-                user_id=user_id,
-                client_name=prepared_data.get("client_name") or extracted_info.get("client_name"),
-                target_date=prepared_data.get("target_date")
-            )
-            
-            if meeting_id:
-                # Found in DB, get meeting object
-                meeting = self.memory.get_meeting_by_id(meeting_id)
-                if meeting:
-                    execution_context["meeting_id"] = meeting_id
-                    execution_context["structured_data"] = {
-                        "meeting_title": meeting.title,
-                        "meeting_date": format_datetime_display(meeting.scheduled_time),
-                        "attendees": meeting.attendees,
-                        "transcript": meeting.transcript,
-                        "has_transcript": meeting.transcript is not None
-                    }
-                    return {"meeting_id": meeting_id, "source": "database"}
-            
-            # Try calendar search
-            calendar_event, meeting_options = meeting_finder.find_meeting_in_calendar(
-                client_name=prepared_data.get("client_name") or extracted_info.get("client_name"),
-                target_date=prepared_data.get("target_date"),
-                user_id=user_id,
-                calendar_event_id=prepared_data.get("calendar_event_id")
-            )
-            
-            if meeting_options:
-                # Multiple matches, return options
-                return {
-                    "tool_name": "meeting_finder",
-                    "meeting_options": meeting_options,
-                    "requires_selection": True
-                }
-            
-            if calendar_event:
-                execution_context["calendar_event"] = calendar_event
-                return {"calendar_event": calendar_event, "source": "calendar"}
-            
-            # Not found
-            return None
+        handler = self._step_handlers.get(action)
+        if handler is None:
+            # Unknown action
+            return {
+                "tool_name": "workflow",
+                "error": f"Unknown action '{action}'",
+                "step": {"action": action, "tool": tool}
+            }
         
-        elif action == "skip_step":
-            return lambda: None
+        # Handlers name the keywords they read and absorb the rest via **kwargs
+        return await handler(
+            step=step,
+            execution_context=execution_context,
+            context=context,
+            prepared_data=prepared_data,
+            extracted_info=extracted_info,
+            user_id=user_id,
+            client_id=client_id
+        )
+    
+    async def _step_find_meeting(
+        self,
+        *,
+        execution_context: Dict[str, Any],
+        prepared_data: Dict[str, Any],
+        extracted_info: Dict[str, Any],
+        user_id: Optional[int],
+        client_id: Optional[int],
+        **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Find the meeting in the database, falling back to a calendar search."""
+        # Try database first
+        meeting_finder = MeetingFinder(self.db, self.memory)
+        meeting_id = meeting_finder.find_meeting_in_database(
+            meeting_id=execution_context.get("meeting_id"),
+            client_id=client_id,
+            user_id=user_id,
+            client_name=prepared_data.get("client_name") or extracted_info.get("client_name"),
+            target_date=prepared_data.get("target_date")
+        )
         
-        elif action == "retrieve_transcript":
-            # Requires calendar_event or meeting_id
-            calendar_event = execution_context.get("calendar_event")
-            meeting_id = execution_context.get("meeting_id")
-            
-            # DIAGNOSTIC: Log the exact condition that triggers the error
-            print(f"\n[DIAGNOSTIC] retrieve_transcript action check:")
-            print(f"   calendar_event: {calendar_event is not None} ({'dict' if isinstance(calendar_event, dict) else type(calendar_event).__name__ if calendar_event else 'None'})")
-            print(f"   meeting_id: {meeting_id}")
-            print(f"   execution_context keys: {list(execution_context.keys())}")
-            if calendar_event:
-                print(f"   calendar_event keys: {list(calendar_event.keys()) if isinstance(calendar_event, dict) else 'N/A'}")
-                print(f"   calendar_event['id']: {calendar_event.get('id') if isinstance(calendar_event, dict) else 'N/A'}")
-            
-            if not calendar_event and not meeting_id:
-                print(f"   [DIAGNOSTIC] ❌ ERROR TRIGGERED: Both calendar_event and meeting_id are None/Missing")
-                print(f"   [DIAGNOSTIC] This is the exact condition that causes: 'Cannot retrieve transcript: no calendar_event or meeting_id'")
-                return {
-                    "tool_name": "integration_fetcher",
-                    "error": "Cannot retrieve transcript: no calendar_event or meeting_id"
+        if meeting_id:
+            # Found in DB, get meeting object
+            meeting = self.memory.get_meeting_by_id(meeting_id)
+            if meeting:
+                execution_context["meeting_id"] = meeting_id
+                execution_context["structured_data"] = {
+                    "meeting_title": meeting.title,
+                    "meeting_date": format_datetime_display(meeting.scheduled_time),
+                    "attendees": meeting.attendees,
+                    "transcript": meeting.transcript,
+                    "has_transcript": meeting.transcript is not None
                 }
-            else:
-                print(f"   [DIAGNOSTIC] ✅ Condition passed: {'calendar_event' if calendar_event else ''}{' + ' if calendar_event and meeting_id else ''}{'meeting_id' if meeting_id else ''} is available")
-            
-            # Extract zoom_meeting_id from calendar_event
-            if calendar_event:
-                from app.integrations.google_calendar_client import extract_zoom_meeting_id_from_event
-                zoom_meeting_id = extract_zoom_meeting_id_from_event(calendar_event)
-                if zoom_meeting_id:
-                    transcript = await self.integration_data_fetcher.fetch_zoom_transcript(
-                        zoom_meeting_id,
-                        extract_event_datetime(calendar_event)
-                    )
-                    if transcript:
-                        execution_context["structured_data"]["transcript"] = transcript
-                        execution_context["structured_data"]["has_transcript"] = True
-                        return {"transcript": transcript}
-            
-            # Try getting transcript from meeting record
-            if meeting_id:
-                meeting = self.memory.get_meeting_by_id(meeting_id)
-                if meeting and meeting.transcript:
-                    execution_context["structured_data"]["transcript"] = meeting.transcript
-                    execution_context["structured_data"]["has_transcript"] = True
-                    return {"transcript": meeting.transcript}
-            
-            return None  # No transcript found
+                return {"meeting_id": meeting_id, "source": "database"}
+        
+        # Try calendar search
+        calendar_event, meeting_options = meeting_finder.find_meeting_in_calendar(
+            client_name=prepared_data.get("client_name") or extracted_info.get("client_name"),
+            target_date=prepared_data.get("target_date"),
+            user_id=user_id,
+            calendar_event_id=prepared_data.get("calendar_event_id")
+        )
         
-        elif action == "summarize":
-            # Build integration_data from execution_context
-            integration_data = {
-                "meeting_id": execution_context.get("meeting_id"),
-                "calendar_event": execution_context.get("calendar_event"),
-                "structured_data": execution_context.get("structured_data", {})
+        if meeting_options:
+            # Multiple matches, return options
+            return {
+                "tool_name": "meeting_finder",
+                "meeting_options": meeting_options,
+                "requires_selection": True
             }
-            
-            # Call existing executor method
-            return await self._execute_summarization(
-                integration_data,
-                user_id,
-                client_id,
-                context
-            )
         
-        elif action == "generate_followup":
-            # Build integration_data from execution_context
-            integration_data = {
-                "meeting_id": execution_context.get("meeting_id"),
-                "structured_data": execution_context.get("structured_data", {})
-            }
-            
-            # Call existing executor method
-            return await self._execute_followup(
-                integration_data,
-                context
-            )
+        if calendar_event:
+            execution_context["calendar_event"] = calendar_event
+            return {"calendar_event": calendar_event, "source": "calendar"}
         
-        elif action == "generate_brief":
-            # Build integration_data from execution_context
-            integration_data = {
-                "structured_data": execution_context.get("structured_data", {})
+        # Not found
+        return None
+    
+    async def _step_skip(
+        self,
+        **kwargs: Any
+    ) -> Callable[[], None]:
+        """Return a no-op callable so the step is skipped."""
+        return lambda: None
+    
+    async def _step_retrieve_transcript(
+        self,
+        *,
+        execution_context: Dict[str, Any],
+        **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch the transcript for the meeting or calendar event found so far."""
+        # Requires calendar_event or meeting_id
+        calendar_event = execution_context.get("calendar_event")
+        meeting_id = execution_context.get("meeting_id")
+        
+        # DIAGNOSTIC: Log the exact condition that triggers the error
+        print(f"\n[DIAGNOSTIC] retrieve_transcript action check:")
+        print(f"   calendar_event: {calendar_event is not None} ({'dict' if isinstance(calendar_event, dict) else type(calendar_event).__name__ if calendar_event else 'None'})")
+        print(f"   meeting_id: {meeting_id}")
+        print(f"   execution_context keys: {list(execution_context.keys())}")
+        if calendar_event:
+            print(f"   calendar_event keys: {list(calendar_event.keys()) if isinstance(calendar_event, dict) else 'N/A'}")
+            print(f"   calendar_event['id']: {calendar_event.get('id') if isinstance(calendar_event, dict) else 'N/A'}")
+        
+        if not calendar_event and not meeting_id:
+            print(f"   [DIAGNOSTIC] ❌ ERROR TRIGGERED: Both calendar_event and meeting_id are None/Missing")
+            print(f"   [DIAGNOSTIC] This is the exact condition that causes: 'Cannot retrieve transcript: no calendar_event or meeting_id'")
+            return {
+                "tool_name": "integration_fetcher",
+                "error": "Cannot retrieve transcript: no calendar_event or meeting_id"
             }
-            
-            # Call existing executor method
-            return await self._execute_meeting_brief(
-                integration_data,
-                context
-            )
+        else:
+            print(f"   [DIAGNOSTIC] ✅ Condition passed: {'calendar_event' if calendar_event else ''}{' + ' if calendar_event and meeting_id else ''}{'meeting_id' if meeting_id else ''} is available")
+        
+        # Extract zoom_meeting_id from calendar_event
+        if calendar_event:
+            from app.integrations.google_calendar_client import extract_zoom_meeting_id_from_event
+            zoom_meeting_id = extract_zoom_meeting_id_from_event(calendar_event)
+            if zoom_meeting_id:
+                transcript = await self.integration_data_fetcher.fetch_zoom_transcript(
+                    zoom_meeting_id,
+                    extract_event_datetime(calendar_event)
+                )
+                if transcript:
+                    execution_context["structured_data"]["transcript"] = transcript
+                    execution_context["structured_data"]["has_transcript"] = True
+                    return {"transcript": transcript}
         
-        elif action == "retrieve_calendar_event":
-            calendar_event_id = prepared_data.get("calendar_event_id")
-            if not calendar_event_id:
-                return {
-                    "tool_name": "integration_fetcher",
-                    "error": "Cannot retrieve calendar event: no calendar_event_id"
-                }
-            
-            from app.integrations.google_calendar_client import get_calendar_event_by_id
-            calendar_event = get_calendar_event_by_id(calendar_event_id)
-            
-            if calendar_event:
-                execution_context["calendar_event"] = calendar_event
-                return {"calendar_event": calendar_event}
-            
-            return None
+        # Try getting transcript from meeting record
+        if meeting_id:
+            meeting = self.memory.get_meeting_by_id(meeting_id)
+            if meeting and meeting.transcript:
+                execution_context["structured_data"]["transcript"] = meeting.transcript
+                execution_context["structured_data"]["has_transcript"] = True
+                return {"transcript": meeting.transcript}
         
-        else:
-            # Unknown action
+        return None  # No transcript found
+    
+    async def _step_summarize(
+        self,
+        *,
+        execution_context: Dict[str, Any],
+        context: Dict[str, Any],
+        user_id: Optional[int],
+        client_id: Optional[int],
+        **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Summarize the meeting in the execution context."""
+        # Build integration_data from execution_context
+        integration_data = {
+            "meeting_id": execution_context.get("meeting_id"),
+            "calendar_event": execution_context.get("calendar_event"),
+            "structured_data": execution_context.get("structured_data", {})
+        }
+        
+        # Call existing executor method
+        return await self._execute_summarization(
+            integration_data,
+            user_id,
+            client_id,
+            context
+        )
+    
+    async def _step_generate_followup(
+        self,
+        *,
+        execution_context: Dict[str, Any],
+        context: Dict[str, Any],
+        **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Generate a follow-up from the execution context."""
+        # Build integration_data from execution_context
+        integration_data = {
+            "meeting_id": execution_context.get("meeting_id"),
+            "structured_data": execution_context.get("structured_data", {})
+        }
+        
+        # Call existing executor method
+        return await self._execute_followup(
+            integration_data,
+            context
+        )
+    
+    async def _step_generate_brief(
+        self,
+        *,
+        execution_context: Dict[str, Any],
+        context: Dict[str, Any],
+        **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Generate a meeting brief from the execution context."""
+        # Build integration_data from execution_context
+        integration_data = {
+            "structured_data": execution_context.get("structured_data", {})
+        }
+        
+        # Call existing executor method
+        return await self._execute_meeting_brief(
+            integration_data,
+            context
+        )
+    
+    async def _step_retrieve_calendar_event(
+        self,
+        *,
+        execution_context: Dict[str, Any],
+        prepared_data: Dict[str, Any],
+        **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch the calendar event referenced by prepared_data."""
+        calendar_event_id = prepared_data.get("calendar_event_id")
+        if not calendar_event_id:
             return {
-                "tool_name": "workflow",
-                "error": f"Unknown action '{action}'",
-                "step": {"action": action, "tool": tool}
+                "tool_name": "integration_fetcher",
+                "error": "Cannot retrieve calendar event: no calendar_event_id"
             }
+        
+        from app.integrations.google_calendar_client import get_calendar_event_by_id
+        calendar_event = get_calendar_event_by_id(calendar_event_id)
+        
+        if calendar_event:
+            execution_context["calendar_event"] = calendar_event
+            return {"calendar_event": calendar_event}
+        
+        return None
     
     def _update_execution_context(
         self,
@@ -1,8 +1,11 @@
 """Workflow planning module."""
 
+import copy
 import json
 import logging
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from time import monotonic
+from typing import Dict, Any, Optional, Tuple
 from app.llm.gemini_client import GeminiClient
 from app.llm.prompts import WORKFLOW_PLANNING_PROMPT
 
@@ -10,7 +13,7 @@ from app.llm.prompts import WORKFLOW_PLANNING_PROMPT
 logger = logging.getLogger(__name__)
 
 
-VALID_ACTIONS = {
+VALID_ACTIONS = frozenset({
     "find_meeting",
     "retrieve_transcript",
     "retrieve_calendar_event",
@@ -22,7 +25,23 @@ VALID_ACTIONS = {
     "force_summarization",
     "skip_step",
     "ask_user_for_meeting",
-}
+})
+
+# Maximum number of validated plans kept (LRU-evicted)
+PLAN_CACHE_SIZE = 256
+
+# Seconds a cached plan is reused before the LLM is asked again. Plans are
+# sampled (temperature > 0), so entries expire rather than pin one sample forever.
+PLAN_CACHE_TTL_SECONDS = 300
+
+# Shared by every planner: the orchestrator (and its planner) is rebuilt per request.
+# Maps cache key -> (expiry on the monotonic clock, plan).
+_plan_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def clear_plan_cache() -> None:
+    """Drop all cached workflow plans."""
+    _plan_cache.clear()
 
 
 class WorkflowPlanner:
@@ -53,6 +72,25 @@ class WorkflowPlanner:
         else:
             logger.debug("WorkflowPlanner: no memory context section in context; proceeding without memory")
         
+        # Repeated requests reuse the validated plan instead of re-prompting the LLM.
+        # The model is part of the key so plans from different models never mix.
+        cache_key = (
+            getattr(self.llm, "model_name", None),
+            intent,
+            message,
+            user_id,
+            client_id,
+            memory_context_section,
+        )
+        cached = _plan_cache.get(cache_key)
+        if cached is not None:
+            expires_at, cached_plan = cached
+            if monotonic() < expires_at:
+                _plan_cache.move_to_end(cache_key)
+                logger.debug("WorkflowPlanner: reusing cached workflow plan")
+                return copy.deepcopy(cached_plan)
+            del _plan_cache[cache_key]
+        
         prompt = f"""Intent: {intent}
 User Message: {message}
 Context: {context_info}
@@ -92,6 +130,12 @@ Plan the workflow and respond in JSON format."""
                             logger.debug(f"Invalid workflow action requested: {action}")
                             step["action"] = "skip_step"
 
+            # Only cache usable plans so a bad LLM response is retried next time
+            if isinstance(steps, list) and steps:
+                _plan_cache[cache_key] = (monotonic() + PLAN_CACHE_TTL_SECONDS, copy.deepcopy(plan))
+                if len(_plan_cache) > PLAN_CACHE_SIZE:
+                    _plan_cache.popitem(last=False)
+
             return plan
         except Exception:
             logger.exception("Workflow planning failed; returning empty plan")
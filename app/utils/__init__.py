@@ -2,8 +2,11 @@
 
 from app.utils.date_utils import (
     parse_iso_datetime,
+    parse_iso_datetimes,
+    clear_parse_iso_datetime_cache,
     format_datetime_display,
-    extract_event_datetime
+    extract_event_datetime,
+    extract_event_datetimes
 )
 from app.utils.calendar_utils import (
     extract_attendees,
@@ -17,8 +20,11 @@ from app.utils.logging_utils import (
 
 __all__ = [
     'parse_iso_datetime',
+    'parse_iso_datetimes',
+    'clear_parse_iso_datetime_cache',
     'format_datetime_display',
     'extract_event_datetime',
+    'extract_event_datetimes',
     'extract_attendees',
     'sort_events_by_date',
     'StructuredLogger',
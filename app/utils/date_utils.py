@@ -1,9 +1,26 @@
 """Date and time utility functions."""
 
-from typing import Optional, Dict, Any
+import re
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterable, List
 from datetime import datetime, timezone
 
 
+# Month names indexed by datetime.month (index 0 unused), as strftime's %B
+_MONTH_NAMES = (
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
+# 12-hour clock hour (zero-padded, as strftime's %I) and %p, indexed by datetime.hour
+_HOUR12 = tuple(f"{(hour - 1) % 12 + 1:02d}" for hour in range(24))
+_AMPM = ("AM",) * 12 + ("PM",) * 12
+
+# Every string fromisoformat accepts starts with an ASCII year followed by
+# "-", a week marker or the month digits ("2024-05-01", "20240501", "2024-W18-3")
+_ISO_SHAPE = re.compile(r'[0-9]{4}[-W0-9]')
+
+
 def parse_iso_datetime(date_str: str, default_tz: timezone = timezone.utc) -> Optional[datetime]:
     """
     Parse ISO format datetime string with timezone handling.
@@ -24,16 +41,57 @@ def parse_iso_datetime(date_str: str, default_tz: timezone = timezone.utc) -> Op
         return None
     
     try:
-        if 'T' in date_str:
-            # Has time component
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        else:
-            # Date only
-            dt = datetime.fromisoformat(date_str)
+        # Reject obviously malformed strings before any parser (or the cache) runs
+        if not _ISO_SHAPE.match(date_str):
+            return None
+        return _parse_iso_datetime_cached(date_str, default_tz)
+    except TypeError:
+        # Non-string or unhashable input (cannot be an ISO string anyway)
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime_cached(
+    date_str: str,
+    default_tz: timezone,
+    _datetime_fromisoformat=datetime.fromisoformat,
+    _utc=timezone.utc
+) -> Optional[datetime]:
+    """
+    Parse a non-empty ISO string (memoized; datetimes are immutable so results are shared).
+    
+    The underscore defaults bind module globals as locals; callers never pass them.
+    """
+    try:
+        # Fast paths for the common fixed-width shapes, keyed on length.
+        # Fields are sliced straight into the datetime constructor with the
+        # tzinfo attached, so no intermediate naive object is built.
+        n = len(date_str)
+        if n == 10 and _is_plain_date(date_str):
+            # Date only: "2024-11-21"
+            return datetime(
+                int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                tzinfo=default_tz
+            )
+        if n == 20 and date_str[-1] == 'Z' and _is_plain_datetime(date_str):
+            # UTC: "2024-11-21T10:00:00Z"
+            dt = _datetime_from_fields(date_str, _utc)
+            return dt if default_tz is _utc else dt.astimezone(default_tz)
+        if n == 19 and _is_plain_datetime(date_str):
+            # Naive: "2024-11-21T10:00:00"
+            return _datetime_from_fields(date_str, default_tz)
+
+        # Other shapes: offsets, fractional seconds, or a trailing UTC designator
+        if date_str[-1] == 'Z' and 'T' in date_str:
+            date_str = date_str[:-1] + '+00:00'
+        dt = _datetime_fromisoformat(date_str)
         
         # Ensure timezone is set
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=default_tz)
+        elif default_tz is _utc and not dt.utcoffset():
+            # Already at UTC offset (e.g. "+00:00"): attach UTC, no conversion needed
+            dt = dt.replace(tzinfo=_utc)
         else:
             dt = dt.astimezone(default_tz)
         
@@ -42,6 +100,61 @@ def parse_iso_datetime(date_str: str, default_tz: timezone = timezone.utc) -> Op
         return None
 
 
+def _is_plain_date(s: str) -> bool:
+    """True if s starts with an ASCII-digit "YYYY-MM-DD" date."""
+    return (
+        s[4] == '-' and s[7] == '-'
+        and s[0:4].isascii() and s[0:4].isdigit()
+        and s[5:7].isascii() and s[5:7].isdigit()
+        and s[8:10].isascii() and s[8:10].isdigit()
+    )
+
+
+def _is_plain_datetime(s: str) -> bool:
+    """True if s starts with an ASCII-digit "YYYY-MM-DDTHH:MM:SS" (or space-separated) datetime."""
+    return (
+        _is_plain_date(s)
+        and s[10] in 'T ' and s[13] == ':' and s[16] == ':'
+        and s[11:13].isascii() and s[11:13].isdigit()
+        and s[14:16].isascii() and s[14:16].isdigit()
+        and s[17:19].isascii() and s[17:19].isdigit()
+    )
+
+
+def _datetime_from_fields(s: str, tz: timezone) -> datetime:
+    """Build an aware datetime from a string already checked by _is_plain_datetime."""
+    return datetime(
+        int(s[0:4]), int(s[5:7]), int(s[8:10]),
+        int(s[11:13]), int(s[14:16]), int(s[17:19]),
+        tzinfo=tz
+    )
+
+
+def clear_parse_iso_datetime_cache() -> None:
+    """Drop memoized parse_iso_datetime results (e.g. in long-running processes)."""
+    _parse_iso_datetime_cached.cache_clear()
+
+
+def parse_iso_datetimes(
+    date_strs: Iterable[Optional[str]],
+    default_tz: timezone = timezone.utc
+) -> List[Optional[datetime]]:
+    """
+    Parse many ISO format datetime strings in one call.
+    
+    Same rules as parse_iso_datetime, applied element-wise.
+    
+    Args:
+        date_strs: Iterable of ISO format datetime strings (None/empty allowed)
+        default_tz: Timezone to use if none is specified (default: UTC)
+    
+    Returns:
+        List of parsed datetimes (None where parsing fails), in input order
+    """
+    parse = parse_iso_datetime
+    return [parse(date_str, default_tz) for date_str in date_strs]
+
+
 def format_datetime_display(dt: Optional[datetime], default: str = "Unknown date") -> str:
     """
     Format datetime to human-readable display string.
@@ -58,6 +171,13 @@ def format_datetime_display(dt: Optional[datetime], default: str = "Unknown date
     if not dt:
         return default
     
+    # Exact-type check first (pointer compare); isinstance keeps subclasses on this path
+    if type(dt) is datetime or isinstance(dt, datetime):
+        # Same output as strftime("%B %d, %Y at %I:%M %p"), built from fields directly
+        hour = dt.hour
+        return f"{_MONTH_NAMES[dt.month]} {dt.day:02d}, {dt.year} at {_HOUR12[hour]}:{dt.minute:02d} {_AMPM[hour]}"
+    
+    # date or datetime-like objects (or anything else): keep the strftime behaviour
     try:
         return dt.strftime("%B %d, %Y at %I:%M %p")
     except (AttributeError, ValueError, TypeError):
@@ -77,13 +197,30 @@ def extract_event_datetime(event: Dict[str, Any]) -> Optional[datetime]:
     if not event:
         return None
     
-    event_start = event.get('start', {})
+    event_start = event.get('start')
     if not event_start:
         return None
     
     start_time_str = event_start.get('dateTime') or event_start.get('date')
-    if not start_time_str:
-        return None
-    
-    return parse_iso_datetime(start_time_str)
+    return parse_iso_datetime(start_time_str) if start_time_str else None
+
 
+def extract_event_datetimes(events: Iterable[Optional[Dict[str, Any]]]) -> List[Optional[datetime]]:
+    """
+    Extract datetimes from many Google Calendar events in one call.
+    
+    Same rules as extract_event_datetime: one pass collects each event's
+    start string, then the strings are parsed together via parse_iso_datetimes.
+    
+    Args:
+        events: Iterable of Google Calendar event dictionaries (None/empty allowed)
+    
+    Returns:
+        List of parsed datetimes (None where extraction fails), in input order
+    """
+    start_strs = []
+    append = start_strs.append
+    for event in events:
+        event_start = event.get('start') if event else None
+        append((event_start.get('dateTime') or event_start.get('date')) if event_start else None)
+    return parse_iso_datetimes(start_strs)
@@ -0,0 +1,64 @@
+"""Shared pytest fixtures for agent orchestration tests."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+
+
+def _reset_async_mock(mock: AsyncMock) -> AsyncMock:
+    """Clear call history, return value and side effect left by a previous test."""
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def _execute_with_plan_async_mock():
+    """Single AsyncMock reused for ToolExecutor._execute_with_plan."""
+    return AsyncMock()
+
+
+@pytest.fixture(scope="session")
+def _fetch_zoom_transcript_async_mock():
+    """Single AsyncMock reused for IntegrationDataFetcher.fetch_zoom_transcript."""
+    return AsyncMock()
+
+
+@pytest.fixture(scope="session")
+def _summarize_meeting_async_mock():
+    """Single AsyncMock reused for SummarizationTool.summarize_meeting."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def execute_with_plan_mock(tool_executor, _execute_with_plan_async_mock):
+    """Attach the shared _execute_with_plan mock to tool_executor (configure return_value per test)."""
+    mock = _reset_async_mock(_execute_with_plan_async_mock)
+    tool_executor._execute_with_plan = mock
+    return mock
+
+
+@pytest.fixture
+def fetch_zoom_transcript_mock(tool_executor, _fetch_zoom_transcript_async_mock):
+    """Attach the shared fetch_zoom_transcript mock to tool_executor's fetcher."""
+    mock = _reset_async_mock(_fetch_zoom_transcript_async_mock)
+    tool_executor.integration_data_fetcher.fetch_zoom_transcript = mock
+    return mock
+
+
+@pytest.fixture
+def summarize_meeting_mock(mock_tools, _summarize_meeting_async_mock):
+    """Attach the shared summarize_meeting mock to the mocked summarization tool."""
+    mock = _reset_async_mock(_summarize_meeting_async_mock)
+    mock_tools["summarization"].summarize_meeting = mock
+    return mock
+
+
+@pytest.fixture
+def patched_meeting_finder(monkeypatch):
+    """Swap ToolExecutor's MeetingFinder class for a mock (undone by monkeypatch).
+
+    Configure the finder instance via ``patched_meeting_finder.return_value``.
+    """
+    mock_finder_class = MagicMock()
+    monkeypatch.setattr("app.orchestrator.tool_execution.MeetingFinder", mock_finder_class)
+    return mock_finder_class
@@ -1,6 +1,8 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+from app.tools import memory_processing
+
 
 @pytest.mark.asyncio
 async def test_output_synthesizer_memory_applied(caplog, mock_output_synthesizer, mock_context, monkeypatch):
@@ -15,7 +17,7 @@ async def test_output_synthesizer_memory_applied(caplog, mock_output_synthesizer
             "open_loops": "follow-up items",
         }
 
-    monkeypatch.setattr("app.tools.memory_processing.synthesize_memory", mock_synthesize_memory)
+    monkeypatch.setattr(memory_processing, "synthesize_memory", mock_synthesize_memory)
 
     tool_output = {"tool_name": "summarization", "result": {"summary": "Original summary"}}
 
@@ -1,7 +1,7 @@
 """Tests for step execution coordination (Step 4)."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 import sys
 from pathlib import Path
 # Add project root to path for imports
@@ -11,9 +11,6 @@ sys.path.insert(0, str(project_root))
 from tests.integrations.test_integration_mocks import (
     build_mock_workflow,
     build_mock_step,
-    build_mock_context,
-    build_mock_prepared_data,
-    build_mock_integration_data,
     build_mock_meeting,
     build_mock_calendar_event
 )
@@ -23,7 +20,10 @@ class TestStepExecution:
     """Tests for step execution coordination."""
     
     @pytest.mark.asyncio
-    async def test_sequential_step_execution(self, tool_executor, mock_memory_repo, mock_tools):
+    async def test_sequential_step_execution(
+        self, run_executor, mock_memory_repo, mock_tools, patched_meeting_finder,
+        fetch_zoom_transcript_mock, summarize_meeting_mock
+    ):
         """Test that steps execute sequentially and update context."""
         # Arrange
         workflow = build_mock_workflow(
@@ -33,56 +33,39 @@ class TestStepExecution:
                 build_mock_step("summarize", "summarization")
             ]
         )
-        context = build_mock_context()
-        prepared_data = build_mock_prepared_data()
-        integration_data = build_mock_integration_data()
         
         # Mock MeetingFinder
-        with patch('app.orchestrator.tool_execution.MeetingFinder') as mock_finder_class:
-            mock_finder = MagicMock()
-            mock_finder_class.return_value = mock_finder
-            mock_finder.find_meeting_in_database.return_value = 123
-            mock_finder.find_meeting_in_calendar.return_value = (None, None)
-            
-            # Mock memory repo
-            mock_meeting = build_mock_meeting(id=123, transcript=None)  # Force fetch
-            mock_memory_repo.get_meeting_by_id.return_value = mock_meeting
-            
-            # Mock integration fetcher
-            tool_executor.integration_data_fetcher.fetch_zoom_transcript = AsyncMock(
-                return_value="Test transcript"
-            )
-            
-            # Mock summarization tool
-            mock_tools["summarization"].summarize_meeting = AsyncMock(return_value={
-                "tool_name": "summarization",
-                "result": {"summary": "Test summary"}
-            })
-            
-            # Act
-            result = await tool_executor.execute(
-                "summarization",
-                "Test message",
-                context,
-                1,
-                2,
-                {},
-                prepared_data,
-                integration_data,
-                workflow=workflow
-            )
-            
-            # Assert
-            assert result is not None
-            assert result.get("tool_name") == "summarization"
-            assert "result" in result
-            # Verify steps were called in order
-            assert mock_finder.find_meeting_in_database.called
-            assert tool_executor.integration_data_fetcher.fetch_zoom_transcript.called
-            assert mock_tools["summarization"].summarize_meeting.called
+        mock_finder = patched_meeting_finder.return_value
+        mock_finder.find_meeting_in_database.return_value = 123
+        mock_finder.find_meeting_in_calendar.return_value = (None, None)
+        
+        # Mock memory repo
+        mock_meeting = build_mock_meeting(id=123, transcript=None)  # Force fetch
+        mock_memory_repo.get_meeting_by_id.return_value = mock_meeting
+        
+        # Mock integration fetcher
+        fetch_zoom_transcript_mock.return_value = "Test transcript"
+        
+        # Mock summarization tool
+        summarize_meeting_mock.return_value = {
+            "tool_name": "summarization",
+            "result": {"summary": "Test summary"}
+        }
+        
+        # Act
+        result = await run_executor(workflow)
+        
+        # Assert
+        assert result is not None
+        assert result.get("tool_name") == "summarization"
+        assert "result" in result
+        # Verify steps were called in order
+        assert mock_finder.find_meeting_in_database.called
+        assert fetch_zoom_transcript_mock.called
+        assert summarize_meeting_mock.called
     
     @pytest.mark.asyncio
-    async def test_step_failure_stops_execution(self, tool_executor):
+    async def test_step_failure_stops_execution(self, run_executor, patched_meeting_finder):
         """Test that step failure stops execution of subsequent steps."""
         # Arrange
         workflow = build_mock_workflow(
@@ -91,45 +74,30 @@ class TestStepExecution:
                 build_mock_step("summarize", "summarization")  # Should NOT execute
             ]
         )
-        context = build_mock_context()
-        prepared_data = build_mock_prepared_data()
-        integration_data = build_mock_integration_data()
         
         # Mock MeetingFinder to return None (failure)
-        with patch('app.orchestrator.tool_execution.MeetingFinder') as mock_finder_class:
-            mock_finder = MagicMock()
-            mock_finder_class.return_value = mock_finder
-            mock_finder.find_meeting_in_database.return_value = None
-            mock_finder.find_meeting_in_calendar.return_value = (None, None)
-            
-            # Mock summarization tool (should NOT be called)
-            mock_tools = MagicMock()
-            mock_tools.summarize_meeting = AsyncMock()
-            
-            # Act
-            result = await tool_executor.execute(
-                "summarization",
-                "Test message",
-                context,
-                1,
-                2,
-                {},
-                prepared_data,
-                integration_data,
-                workflow=workflow
-            )
-            
-            # Assert
-            assert result is not None
-            assert result.get("tool_name") == "summarization"  # Error preserves original tool_name
-            assert "error" in result
-            assert "did not produce required output" in result["error"]
-            # Summarization should NOT be called
-            # (We can't directly assert this since tool_executor uses internal tools,
-            # but the error indicates execution stopped)
+        mock_finder = patched_meeting_finder.return_value
+        mock_finder.find_meeting_in_database.return_value = None
+        mock_finder.find_meeting_in_calendar.return_value = (None, None)
+        
+        # Mock summarization tool (should NOT be called)
+        mock_tools = MagicMock()
+        mock_tools.summarize_meeting = AsyncMock()
+        
+        # Act
+        result = await run_executor(workflow)
+        
+        # Assert
+        assert result is not None
+        assert result.get("tool_name") == "summarization"  # Error preserves original tool_name
+        assert "error" in result
+        assert "did not produce required output" in result["error"]
+        # Summarization should NOT be called
+        # (We can't directly assert this since tool_executor uses internal tools,
+        # but the error indicates execution stopped)
     
     @pytest.mark.asyncio
-    async def test_step_ordering_enforced(self, tool_executor, mock_memory_repo):
+    async def test_step_ordering_enforced(self, run_executor, mock_memory_repo):
         """Test that steps execute in workflow order, not dependency order."""
         # Arrange - Steps in "wrong" order (summarize before retrieve_transcript)
         workflow = build_mock_workflow(
@@ -139,22 +107,9 @@ class TestStepExecution:
                 build_mock_step("find_meeting", "meeting_finder")  # Step 2 (should NOT run)
             ]
         )
-        context = build_mock_context()
-        prepared_data = build_mock_prepared_data()
-        integration_data = build_mock_integration_data()
         
         # Act
-        result = await tool_executor.execute(
-            "summarization",
-            "Test message",
-            context,
-            1,
-            2,
-            {},
-            prepared_data,
-            integration_data,
-            workflow=workflow
-        )
+        result = await run_executor(workflow)
         
         # Assert
         assert result is not None
@@ -164,7 +119,7 @@ class TestStepExecution:
         # Execution should stop after first step fails
     
     @pytest.mark.asyncio
-    async def test_unknown_action_handled(self, tool_executor):
+    async def test_unknown_action_handled(self, run_executor):
         """Test that unknown actions return error immediately."""
         # Arrange
         workflow = build_mock_workflow(
@@ -172,22 +127,9 @@ class TestStepExecution:
                 build_mock_step("unknown_action", "unknown_tool")
             ]
         )
-        context = build_mock_context()
-        prepared_data = build_mock_prepared_data()
-        integration_data = build_mock_integration_data()
         
         # Act
-        result = await tool_executor.execute(
-            "summarization",
-            "Test message",
-            context,
-            1,
-            2,
-            {},
-            prepared_data,
-            integration_data,
-            workflow=workflow
-        )
+        result = await run_executor(workflow)
         
         # Assert
         assert result is not None
@@ -197,7 +139,55 @@ class TestStepExecution:
         assert "unknown_action" in result["error"]
     
     @pytest.mark.asyncio
-    async def test_multi_step_pipeline(self, tool_executor, mock_memory_repo, mock_tools):
+    async def test_unknown_action_fails_before_earlier_steps(self, run_executor, patched_meeting_finder):
+        """Test that an unknown action without fallback is rejected before any step runs."""
+        # Arrange
+        workflow = build_mock_workflow(
+            steps=[
+                build_mock_step("find_meeting", "meeting_finder"),
+                build_mock_step("unknown_action", "unknown_tool")
+            ]
+        )
+        
+        # Act
+        result = await run_executor(workflow)
+        
+        # Assert
+        assert result.get("tool_name") == "workflow"
+        assert "Unknown action 'unknown_action'" in result["error"]
+        assert result["step"]["index"] == 1
+        patched_meeting_finder.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_planner_valid_action_without_handler_fails_when_reached(
+        self, run_executor, patched_meeting_finder
+    ):
+        """Test that a planner-valid action with no handler lets earlier steps run first."""
+        # Arrange
+        workflow = build_mock_workflow(
+            steps=[
+                build_mock_step("find_meeting", "meeting_finder"),
+                build_mock_step("ask_user_for_meeting", "meeting_finder")
+            ]
+        )
+        mock_finder = patched_meeting_finder.return_value
+        mock_finder.find_meeting_in_database.return_value = None
+        mock_finder.find_meeting_in_calendar.return_value = (None, None)
+        
+        # Act
+        result = await run_executor(workflow)
+        
+        # Assert
+        assert result.get("tool_name") == "workflow"
+        assert "Unknown action 'ask_user_for_meeting'" in result["error"]
+        assert result["step"]["index"] == 1
+        assert mock_finder.find_meeting_in_database.called
+    
+    @pytest.mark.asyncio
+    async def test_multi_step_pipeline(
+        self, run_executor, mock_memory_repo, mock_tools, patched_meeting_finder,
+        fetch_zoom_transcript_mock, summarize_meeting_mock
+    ):
         """Test multi-step pipeline with context updates."""
         # Arrange
         workflow = build_mock_workflow(
@@ -207,52 +197,35 @@ class TestStepExecution:
                 build_mock_step("summarize", "summarization")
             ]
         )
-        context = build_mock_context()
-        prepared_data = build_mock_prepared_data()
-        integration_data = build_mock_integration_data()
         
         # Mock MeetingFinder
-        with patch('app.orchestrator.tool_execution.MeetingFinder') as mock_finder_class:
-            mock_finder = MagicMock()
-            mock_finder_class.return_value = mock_finder
-            mock_finder.find_meeting_in_database.return_value = 123
-            mock_finder.find_meeting_in_calendar.return_value = (None, None)
-            
-            # Mock memory repo
-            mock_meeting = build_mock_meeting(id=123, transcript="Test transcript")
-            mock_memory_repo.get_meeting_by_id.return_value = mock_meeting
-            
-            # Mock integration fetcher
-            tool_executor.integration_data_fetcher.fetch_zoom_transcript = AsyncMock(
-                return_value="Test transcript"
-            )
-            
-            # Mock summarization tool
-            mock_tools["summarization"].summarize_meeting = AsyncMock(return_value={
-                "tool_name": "summarization",
-                "result": {"summary": "Test summary"}
-            })
-            
-            # Act
-            result = await tool_executor.execute(
-                "summarization",
-                "Test message",
-                context,
-                1,
-                2,
-                {},
-                prepared_data,
-                integration_data,
-                workflow=workflow
-            )
-            
-            # Assert
-            assert result is not None
-            assert result.get("tool_name") == "summarization"
-            assert "result" in result
-            assert result["result"].get("summary") == "Test summary"
-            # Verify all steps executed
-            assert mock_finder.find_meeting_in_database.called
-            assert tool_executor.integration_data_fetcher.fetch_zoom_transcript.called
-            assert mock_tools["summarization"].summarize_meeting.called
+        mock_finder = patched_meeting_finder.return_value
+        mock_finder.find_meeting_in_database.return_value = 123
+        mock_finder.find_meeting_in_calendar.return_value = (None, None)
+        
+        # Mock memory repo
+        mock_meeting = build_mock_meeting(id=123, transcript="Test transcript")
+        mock_memory_repo.get_meeting_by_id.return_value = mock_meeting
+        
+        # Mock integration fetcher
+        fetch_zoom_transcript_mock.return_value = "Test transcript"
+        
+        # Mock summarization tool
+        summarize_meeting_mock.return_value = {
+            "tool_name": "summarization",
+            "result": {"summary": "Test summary"}
+        }
+        
+        # Act
+        result = await run_executor(workflow)
+        
+        # Assert
+        assert result is not None
+        assert result.get("tool_name") == "summarization"
+        assert "result" in result
+        assert result["result"].get("summary") == "Test summary"
+        # Verify all steps executed
+        assert mock_finder.find_meeting_in_database.called
+        assert fetch_zoom_transcript_mock.called
+        assert summarize_meeting_mock.called
 
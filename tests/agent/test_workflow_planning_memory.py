@@ -1,19 +1,30 @@
 import pytest
+from unittest.mock import MagicMock
 
+from app.tools import memory_processing
 
-@pytest.mark.asyncio
-async def test_workflow_planner_no_memory(monkeypatch, mock_llm):
+
+@pytest.fixture(scope="module")
+def planner():
     from app.orchestrator.workflow_planning import WorkflowPlanner
 
-    planner = WorkflowPlanner(mock_llm)
+    return WorkflowPlanner(MagicMock(model_name="test-model"))
+
+
+@pytest.fixture(autouse=True)
+def _reset_planner(planner):
+    planner.llm.reset_mock(return_value=True, side_effect=True)
 
+
+@pytest.mark.asyncio
+async def test_workflow_planner_no_memory(monkeypatch, planner):
     captured_prompt = {}
 
     def fake_llm_chat(prompt, system_prompt, response_format, temperature):
         captured_prompt["prompt"] = prompt
         return {"steps": [{"action": "summarize", "tool": "summarization"}]}
 
-    mock_llm.llm_chat.side_effect = fake_llm_chat
+    planner.llm.llm_chat.side_effect = fake_llm_chat
 
     plan = await planner.plan("summarization", "msg", 1, 2, context=None)
 
@@ -24,15 +35,11 @@ async def test_workflow_planner_no_memory(monkeypatch, mock_llm):
 
 
 @pytest.mark.asyncio
-async def test_workflow_planner_with_memory(monkeypatch, mock_llm):
-    from app.orchestrator.workflow_planning import WorkflowPlanner
-
-    planner = WorkflowPlanner(mock_llm)
-
+async def test_workflow_planner_with_memory(monkeypatch, planner):
     def fake_synthesize_memory(past_context, llm_client):
         return {"communication_style": "direct", "preferences": "concise"}
 
-    monkeypatch.setattr("app.tools.memory_processing.synthesize_memory", fake_synthesize_memory)
+    monkeypatch.setattr(memory_processing, "synthesize_memory", fake_synthesize_memory)
 
     captured_prompt = {}
 
@@ -40,7 +47,7 @@ async def test_workflow_planner_with_memory(monkeypatch, mock_llm):
         captured_prompt["prompt"] = prompt
         return {"steps": [{"action": "summarize", "tool": "summarization"}]}
 
-    mock_llm.llm_chat.side_effect = fake_llm_chat
+    planner.llm.llm_chat.side_effect = fake_llm_chat
 
     context = {"user_memories": ["a", "b", "c"]}
     plan = await planner.plan("summarization", "msg", 1, 2, context=context)
@@ -54,15 +61,11 @@ async def test_workflow_planner_with_memory(monkeypatch, mock_llm):
 
 
 @pytest.mark.asyncio
-async def test_workflow_planner_invalid_actions_sanitized(monkeypatch, mock_llm):
-    from app.orchestrator.workflow_planning import WorkflowPlanner
-
-    planner = WorkflowPlanner(mock_llm)
-
+async def test_workflow_planner_invalid_actions_sanitized(monkeypatch, planner):
     def fake_llm_chat(prompt, system_prompt, response_format, temperature):
         return {"steps": [{"action": "retrieve_memory"}, {"action": "delete_meeting"}, {"action": "summarize"}]}
 
-    mock_llm.llm_chat.side_effect = fake_llm_chat
+    planner.llm.llm_chat.side_effect = fake_llm_chat
 
     plan = await planner.plan("summarization", "msg", 1, 2, context=None)
 
@@ -71,3 +74,56 @@ async def test_workflow_planner_invalid_actions_sanitized(monkeypatch, mock_llm)
     assert actions[1] == "skip_step"
     assert actions[2] == "summarize"
 
+
+@pytest.mark.asyncio
+async def test_workflow_planner_reuses_cached_plan(planner):
+    planner.llm.llm_chat.return_value = {"steps": [{"action": "summarize", "tool": "summarization"}]}
+
+    first = await planner.plan("summarization", "msg", 1, 2, context=None)
+    first["steps"].append({"action": "generate_followup"})
+    second = await planner.plan("summarization", "msg", 1, 2, context=None)
+
+    assert planner.llm.llm_chat.call_count == 1
+    assert second == {"steps": [{"action": "summarize", "tool": "summarization"}]}
+
+    await planner.plan("summarization", "other msg", 1, 2, context=None)
+    assert planner.llm.llm_chat.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_plan_is_shared_across_planner_instances(planner):
+    from app.orchestrator.workflow_planning import WorkflowPlanner
+
+    planner.llm.llm_chat.return_value = {"steps": [{"action": "summarize", "tool": "summarization"}]}
+    await planner.plan("summarization", "msg", 1, 2, context=None)
+
+    # The orchestrator builds a fresh planner per request; it must still hit the cache
+    fresh_planner = WorkflowPlanner(MagicMock(model_name="test-model"))
+    plan = await fresh_planner.plan("summarization", "msg", 1, 2, context=None)
+
+    fresh_planner.llm.llm_chat.assert_not_called()
+    assert plan == {"steps": [{"action": "summarize", "tool": "summarization"}]}
+
+    # A different model never sees another model's plans
+    other_model_planner = WorkflowPlanner(MagicMock(model_name="other-model"))
+    other_model_planner.llm.llm_chat.return_value = {"steps": [{"action": "generate_brief", "tool": "meeting_brief"}]}
+    await other_model_planner.plan("summarization", "msg", 1, 2, context=None)
+    other_model_planner.llm.llm_chat.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cached_plan_expires_after_ttl(monkeypatch, planner):
+    from app.orchestrator import workflow_planning
+
+    now = {"t": 1000.0}
+    monkeypatch.setattr(workflow_planning, "monotonic", lambda: now["t"])
+    planner.llm.llm_chat.return_value = {"steps": [{"action": "summarize", "tool": "summarization"}]}
+
+    await planner.plan("summarization", "msg", 1, 2, context=None)
+    now["t"] += workflow_planning.PLAN_CACHE_TTL_SECONDS - 1
+    await planner.plan("summarization", "msg", 1, 2, context=None)
+    assert planner.llm.llm_chat.call_count == 1
+
+    now["t"] += 2
+    await planner.plan("summarization", "msg", 1, 2, context=None)
+    assert planner.llm.llm_chat.call_count == 2
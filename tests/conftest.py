@@ -1,6 +1,15 @@
+import sys
+from pathlib import Path
+
 import pytest
 from unittest.mock import MagicMock
 
+# Make the project root importable once per session (guarded so repeated
+# conftest loads do not keep prepending duplicates to sys.path).
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
 
 @pytest.fixture
 def mock_llm():
@@ -37,12 +46,15 @@ def mock_output_synthesizer(mock_llm):
 """Shared pytest fixtures and utilities for all tests."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, NonCallableMagicMock, patch
 from sqlalchemy.orm import Session
 from typing import Dict, Any, Optional, List
 
+# Imported at module level on purpose: loading conftest pulls in the whole
+# app.orchestrator / app.tools import graph once, before the first test runs.
 from app.orchestrator.agent import AgentOrchestrator
 from app.orchestrator.tool_execution import ToolExecutor
+from app.orchestrator.workflow_planning import clear_plan_cache
 from app.memory.repo import MemoryRepository
 from app.orchestrator.meeting_finder import MeetingFinder
 from app.orchestrator.integration_data_fetching import IntegrationDataFetcher
@@ -50,6 +62,22 @@ from app.tools.summarization import SummarizationTool
 from app.tools.followup import FollowUpTool
 from app.tools.meeting_brief import MeetingBriefTool
 from app.llm.gemini_client import GeminiClient
+from tests.integrations.test_integration_mocks import (
+    build_mock_context,
+    build_mock_prepared_data,
+    build_mock_integration_data
+)
+
+
+# MemoryRepository has no async methods, so a plain name list is an equivalent
+# spec and spares MagicMock from re-introspecting the class for every test.
+_MEMORY_REPOSITORY_SPEC = dir(MemoryRepository)
+
+
+@pytest.fixture(autouse=True)
+def _clear_workflow_plan_cache():
+    """Keep cached workflow plans from leaking between tests."""
+    clear_plan_cache()
 
 
 @pytest.fixture
@@ -69,7 +97,7 @@ def mock_llm():
 @pytest.fixture
 def mock_memory_repo():
     """Mock memory repository."""
-    repo = MagicMock(spec=MemoryRepository)
+    repo = NonCallableMagicMock(spec=_MEMORY_REPOSITORY_SPEC)
     repo.get_meeting_by_id = MagicMock(return_value=None)
     repo.get_client_by_id = MagicMock(return_value=None)
     repo.get_memory_by_key = MagicMock(return_value=None)
@@ -91,7 +119,7 @@ def mock_memory_repo():
 @pytest.fixture
 def mock_meeting_finder():
     """Mock meeting finder."""
-    finder = MagicMock(spec=MeetingFinder)
+    finder = NonCallableMagicMock(spec=MeetingFinder)
     finder.find_meeting_in_database = MagicMock(return_value=None)
     finder.find_meeting_in_calendar = MagicMock(return_value=(None, None))
     return finder
@@ -100,7 +128,7 @@ def mock_meeting_finder():
 @pytest.fixture
 def mock_integration_fetcher():
     """Mock integration data fetcher."""
-    fetcher = MagicMock(spec=IntegrationDataFetcher)
+    fetcher = NonCallableMagicMock(spec=IntegrationDataFetcher)
     fetcher.fetch_zoom_transcript = AsyncMock(return_value=None)
     fetcher.process_calendar_event_for_summarization = AsyncMock(return_value={})
     fetcher.prepare_integration_data = AsyncMock(return_value={})
@@ -111,9 +139,9 @@ def mock_integration_fetcher():
 def mock_tools():
     """Mock all tools."""
     return {
-        "summarization": MagicMock(spec=SummarizationTool),
-        "followup": MagicMock(spec=FollowUpTool),
-        "meeting_brief": MagicMock(spec=MeetingBriefTool)
+        "summarization": NonCallableMagicMock(spec=SummarizationTool),
+        "followup": NonCallableMagicMock(spec=FollowUpTool),
+        "meeting_brief": NonCallableMagicMock(spec=MeetingBriefTool)
     }
 
 
@@ -130,6 +158,35 @@ def tool_executor(mock_db, mock_memory_repo, mock_tools, mock_integration_fetche
     )
 
 
+@pytest.fixture
+def run_executor(tool_executor):
+    """Run tool_executor.execute with test defaults, varying only the workflow inputs.
+
+    The default intent is summarization. Pass an intent with no legacy handler
+    (e.g. "unsupported_intent") to see what the workflow path alone returns.
+    """
+    async def _run(
+        workflow,
+        integration_data=None,
+        client_id=2,
+        prepared_data=None,
+        context=None,
+        intent="summarization"
+    ):
+        return await tool_executor.execute(
+            intent,
+            "Test message",
+            build_mock_context() if context is None else context,
+            1,
+            client_id,
+            {},
+            build_mock_prepared_data() if prepared_data is None else prepared_data,
+            build_mock_integration_data() if integration_data is None else integration_data,
+            workflow=workflow
+        )
+    return _run
+
+
 @pytest.fixture
 def agent_orchestrator(mock_db, mock_llm):
     """Create AgentOrchestrator with mocked dependencies."""
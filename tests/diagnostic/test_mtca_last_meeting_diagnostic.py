@@ -9,19 +9,33 @@ This test reproduces the scenario where:
 """
 
 import pytest
-import asyncio
-from unittest.mock import MagicMock, AsyncMock, patch
+import logging
+from dataclasses import dataclass
+from unittest.mock import MagicMock, patch
 from datetime import datetime, timezone, timedelta
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from typing import Optional
 
 from app.orchestrator.agent import AgentOrchestrator
 from app.memory.repo import MemoryRepository
-from app.memory.models import Meeting, Client
 from sqlalchemy.orm import Session
+from tests.integrations.test_integration_mocks import FakeMeeting
+
+
+logger = logging.getLogger(__name__)
+
+# Single reference time so DB meetings and calendar events share one clock
+_NOW = datetime.now(timezone.utc)
+
+
+@dataclass
+class FakeClient:
+    """Plain stand-in for the Client model (no SQLAlchemy spec introspection)."""
+    id: int
+    name: str
+    email: Optional[str] = None
+    company: Optional[str] = None
+    hubspot_id: Optional[str] = None
+    extra_data: Optional[dict] = None
 
 
 @pytest.fixture
@@ -30,38 +44,33 @@ def mock_db():
     return MagicMock(spec=Session)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_memory_repo():
     """Create a mock memory repository with MTCA meetings without transcripts."""
     repo = MagicMock(spec=MemoryRepository)
     
     # Create mock MTCA client
-    mtca_client = MagicMock(spec=Client)
-    mtca_client.id = 1
-    mtca_client.name = "MTCA"
+    mtca_client = FakeClient(id=1, name="MTCA")
     
-    # Create mock meetings for MTCA (past meetings, no transcripts)
-    now = datetime.now(timezone.utc)
-    past_date_1 = now - timedelta(days=5)
-    past_date_2 = now - timedelta(days=10)
+    # Create mock meetings for MTCA (past meetings, no transcripts or recordings)
+    past_date_1 = (_NOW - timedelta(days=5)).replace(tzinfo=None)
+    past_date_2 = (_NOW - timedelta(days=10)).replace(tzinfo=None)
     
-    meeting_1 = MagicMock(spec=Meeting)
-    meeting_1.id = 1
-    meeting_1.title = "MTCA Strategy Meeting"
-    meeting_1.scheduled_time = past_date_1.replace(tzinfo=None)
-    meeting_1.transcript = None  # No transcript
-    meeting_1.recording_url = None  # No recording
-    meeting_1.client_id = 1
-    meeting_1.client = mtca_client
+    meeting_1 = FakeMeeting(
+        id=1,
+        title="MTCA Strategy Meeting",
+        scheduled_time=past_date_1,
+        client_id=1,
+        client=mtca_client
+    )
     
-    meeting_2 = MagicMock(spec=Meeting)
-    meeting_2.id = 2
-    meeting_2.title = "MTCA Quarterly Review"
-    meeting_2.scheduled_time = past_date_2.replace(tzinfo=None)
-    meeting_2.transcript = None  # No transcript
-    meeting_2.recording_url = None  # No recording
-    meeting_2.client_id = 1
-    meeting_2.client = mtca_client
+    meeting_2 = FakeMeeting(
+        id=2,
+        title="MTCA Quarterly Review",
+        scheduled_time=past_date_2,
+        client_id=1,
+        client=mtca_client
+    )
     
     # Mock repository methods
     repo.search_clients_by_name.return_value = [mtca_client]
@@ -72,11 +81,10 @@ def mock_memory_repo():
     return repo
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_calendar_events():
     """Create mock calendar events for MTCA."""
-    now = datetime.now(timezone.utc)
-    event_date_1 = now - timedelta(days=3)  # More recent than DB meetings
+    event_date_1 = _NOW - timedelta(days=3)  # More recent than DB meetings
     
     events = [
         {
@@ -107,68 +115,52 @@ async def test_mtca_last_meeting_diagnostic(mock_db, mock_memory_repo, mock_cale
     3. Why calendar_event is not converted to meeting_id
     4. What condition triggers "Cannot retrieve transcript: no calendar_event or meeting_id"
     """
+    mock_llm = MagicMock()
+    
+    # Mock intent recognition
+    mock_llm.llm_chat.return_value = {
+        "intent": "summarize_meeting",
+        "client_name": "MTCA",
+        "confidence": 0.9
+    }
+    
+    # AgentOrchestrator builds its own LLM client and repository from the session,
+    # and the meeting finder holds direct references to the calendar functions
+    with patch('app.orchestrator.agent.GeminiClient', return_value=mock_llm), \
+         patch('app.orchestrator.agent.MemoryRepository', return_value=mock_memory_repo), \
+         patch.multiple(
+             'app.orchestrator.meeting_finder',
+             search_calendar_events_by_keyword=MagicMock(return_value=mock_calendar_events),
+             get_calendar_events_on_date=MagicMock(return_value=mock_calendar_events),
+             get_calendar_events_by_time_range=MagicMock(return_value=mock_calendar_events),
+             get_calendar_event_by_id=MagicMock(return_value=mock_calendar_events[0]),
+         ):
+        orchestrator = AgentOrchestrator(mock_db)
+    
+        # Run the diagnostic test
+        logger.debug(
+            "Diagnostic scenario: 'Summarize my last meeting with MTCA' with 2 past "
+            "MTCA meetings in DB (no transcripts) and 1 more recent MTCA calendar event"
+        )
     
-    # Mock Google Calendar client
-    with patch('app.integrations.google_calendar_client.search_calendar_events_by_keyword') as mock_search:
-        # Return mock calendar events (most recent one)
-        mock_search.return_value = mock_calendar_events
-        
-        # Mock LLM responses
-        with patch('app.llm.gemini_client.GeminiClient') as mock_llm_class:
-            mock_llm = MagicMock()
-            mock_llm_class.return_value = mock_llm
-            
-            # Mock intent recognition
-            mock_llm.llm_chat.return_value = {
-                "intent": "summarize_meeting",
-                "client_name": "MTCA",
-                "confidence": 0.9
-            }
-            
-            # Create orchestrator
-            orchestrator = AgentOrchestrator(mock_db, mock_memory_repo, mock_llm)
-            
-            # Run the diagnostic test
-            print("\n" + "="*80)
-            print("DIAGNOSTIC TEST: Summarize my last meeting with MTCA")
-            print("="*80)
-            print("\nTest Scenario:")
-            print("  - User asks: 'Summarize my last meeting with MTCA'")
-            print("  - Database has 2 past MTCA meetings (no transcripts)")
-            print("  - Calendar has 1 more recent MTCA event")
-            print("  - Expected: System should select calendar event or ask for selection")
-            print("\n" + "-"*80)
-            
-            try:
-                result = await orchestrator.process_message(
-                    message="Summarize my last meeting with MTCA",
-                    user_id=1,
-                    debug=True
-                )
-                
-                print("\n" + "-"*80)
-                print("RESULT:")
-                print(f"  Response: {result.get('response', 'N/A')[:200]}...")
-                print(f"  Tool used: {result.get('tool_used', 'N/A')}")
-                print(f"  Meeting options: {result.get('meeting_options', 'N/A')}")
-                print(f"  Error: {result.get('metadata', {}).get('error', 'None')}")
-                
-            except Exception as e:
-                print(f"\n❌ EXCEPTION: {type(e).__name__}: {str(e)}")
-                import traceback
-                print("\nTraceback:")
-                print(traceback.format_exc())
-            
-            print("\n" + "="*80)
-            print("END DIAGNOSTIC TEST")
-            print("="*80 + "\n")
+        result = await orchestrator.process_message(
+            message="Summarize my last meeting with MTCA",
+            user_id=1,
+            debug=True
+        )
+    
+    logger.debug(
+        "Diagnostic result: response=%s tool_used=%s meeting_options=%s error=%s",
+        str(result.get('response', 'N/A'))[:200],
+        result.get('tool_used', 'N/A'),
+        result.get('meeting_options', 'N/A'),
+        result.get('metadata', {}).get('error', 'None')
+    )
+    
+    assert isinstance(result, dict)
+    assert "response" in result
 
 
 if __name__ == "__main__":
-    # Run the test directly
-    asyncio.run(test_mtca_last_meeting_diagnostic(
-        MagicMock(spec=Session),
-        MagicMock(spec=MemoryRepository),
-        []
-    ))
-
+    # Run through pytest so the fixtures and asyncio plugin are applied
+    raise SystemExit(pytest.main([__file__, "-v", "-s"]))
@@ -6,68 +6,21 @@ Ensures:
 - sorting newest → oldest
 """
 
-import sys
-import types
-from datetime import date as _dt_date
-
-# --- Stub Google modules to avoid external deps during import ---
-stub_googleapiclient = types.ModuleType("googleapiclient")
-stub_googleapiclient.discovery = types.ModuleType("googleapiclient.discovery")
-stub_googleapiclient.discovery.build = lambda *a, **k: None
-sys.modules["googleapiclient"] = stub_googleapiclient
-sys.modules["googleapiclient.discovery"] = stub_googleapiclient.discovery
-
-stub_google_pkg = types.ModuleType("google")
-stub_google_auth = types.ModuleType("google.auth")
-stub_google_auth.transport = types.ModuleType("google.auth.transport")
-stub_google_auth.transport.requests = types.ModuleType("google.auth.transport.requests")
-stub_google_auth.credentials = types.ModuleType("google.auth.credentials")
-stub_google_auth.transport.requests.Request = type("Request", (), {})
-stub_google_auth.external_account_authorized_user = lambda *args, **kwargs: None
-stub_google_oauth2 = types.ModuleType("google.oauth2")
-stub_google_oauth2.service_account = types.ModuleType("google.oauth2.service_account")
-stub_google_oauth2.credentials = types.ModuleType("google.oauth2.credentials")
-stub_google_oauth2.credentials.Credentials = type("Credentials", (), {})
-
-stub_google_auth_oauthlib = types.ModuleType("google_auth_oauthlib")
-stub_google_auth_oauthlib.flow = types.ModuleType("google_auth_oauthlib.flow")
-stub_google_auth_oauthlib.helpers = types.ModuleType("google_auth_oauthlib.helpers")
-stub_google_auth_oauthlib.flow.InstalledAppFlow = type(
-    "InstalledAppFlow",
-    (),
-    {
-        "from_client_secrets_file": classmethod(lambda cls, *a, **k: cls()),
-        "run_local_server": lambda self, *a, **k: None,
-    },
-)
-
-dummy_settings = types.SimpleNamespace(
-    google_client_secret_file="client_secret.json",
-    google_token_file="token.json",
-    google_scopes="https://www.googleapis.com/auth/calendar.readonly",
-    google_client_id="dummy",
-    google_client_secret="dummy",
-)
-stub_app_config = types.ModuleType("app.config")
-stub_app_config.settings = dummy_settings
-sys.modules["app.config"] = stub_app_config
-
-sys.modules["google"] = stub_google_pkg
-sys.modules["google.auth"] = stub_google_auth
-sys.modules["google.auth.transport"] = stub_google_auth.transport
-sys.modules["google.auth.transport.requests"] = stub_google_auth.transport.requests
-sys.modules["google.auth.credentials"] = stub_google_auth.credentials
-sys.modules["google.oauth2"] = stub_google_oauth2
-sys.modules["google.oauth2.service_account"] = stub_google_oauth2.service_account
-sys.modules["google.oauth2.credentials"] = stub_google_oauth2.credentials
-sys.modules["google_auth_oauthlib"] = stub_google_auth_oauthlib
-sys.modules["google_auth_oauthlib.flow"] = stub_google_auth_oauthlib.flow
-sys.modules["google_auth_oauthlib.helpers"] = stub_google_auth_oauthlib.helpers
+from datetime import date as _dt_date, datetime, timezone
 
 from app.integrations.google_calendar_client import GoogleCalendarClient
 from app.utils.date_utils import extract_event_datetime
 
 
+TARGET_DATE = _dt_date(2025, 10, 29)
+
+# Start times of the 2025 fixture events, already in newest -> oldest order
+EXPECTED_DESC_TIMES = [
+    datetime(2025, 10, 29, 18, 0, tzinfo=timezone.utc),
+    datetime(2025, 10, 29, 9, 0, tzinfo=timezone.utc),
+]
+
+
 class MockEventsList:
     def __init__(self, pages):
         self.pages = pages
@@ -102,8 +55,6 @@ def make_event(event_id, summary, iso_datetime):
 
 
 def test_get_events_on_date_filters_year_and_sorts_newest_first():
-    target_date = _dt_date(2025, 10, 29)
-
     page1_events = [
         make_event("evt-2024", "Old 2024 event", "2024-10-29T09:00:00Z"),
         make_event("evt-2025-1", "2025 morning", "2025-10-29T09:00:00Z"),
@@ -121,7 +72,7 @@ def test_get_events_on_date_filters_year_and_sorts_newest_first():
     client = object.__new__(GoogleCalendarClient)
     client.service = mock_service
 
-    events = client.get_events_on_date(target_date)
+    events = client.get_events_on_date(TARGET_DATE)
 
     # Assert query params
     assert mock_service.events_list.captured_params, "No requests captured"
@@ -139,5 +90,5 @@ def test_get_events_on_date_filters_year_and_sorts_newest_first():
 
     # Sorted newest -> oldest
     times = [extract_event_datetime(e) for e in events]
-    assert times == sorted(times, reverse=True)
+    assert times == EXPECTED_DESC_TIMES
 
@@ -1,6 +1,9 @@
 """Mock utilities and builder functions for test suite."""
 
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass
+from itertools import chain, repeat
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping
 from unittest.mock import MagicMock
 from datetime import datetime
 
@@ -24,12 +27,8 @@ def build_mock_step(
     fallback: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """Build a mock step dict."""
-    step = {"action": action, "tool": tool}
-    if prerequisites:
-        step["prerequisites"] = prerequisites
-    if fallback:
-        step["fallback"] = fallback
-    return step
+    optional = (("prerequisites", prerequisites), ("fallback", fallback))
+    return {"action": action, "tool": tool, **{k: v for k, v in optional if v is not None}}
 
 
 def build_mock_fallback(
@@ -39,14 +38,12 @@ def build_mock_fallback(
     message_to_user: Optional[str] = None
 ) -> Dict[str, Any]:
     """Build a mock fallback dict."""
-    fallback = {"action": action}
-    if conditions:
-        fallback["conditions"] = conditions
-    if max_attempts:
-        fallback["max_attempts"] = max_attempts
-    if message_to_user:
-        fallback["message_to_user"] = message_to_user
-    return fallback
+    optional = (
+        ("conditions", conditions),
+        ("max_attempts", max_attempts),
+        ("message_to_user", message_to_user),
+    )
+    return {"action": action, **{k: v for k, v in optional if v is not None}}
 
 
 def build_mock_context(
@@ -55,14 +52,11 @@ def build_mock_context(
     persistent_memory: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """Build a mock context dict."""
-    context = {}
-    if user_memories:
-        context["user_memories"] = user_memories
-    if client_context:
-        context["client_context"] = client_context
-    if persistent_memory:
-        context["persistent_memory"] = persistent_memory
-    return context
+    return {k: v for k, v in (
+        ("user_memories", user_memories),
+        ("client_context", client_context),
+        ("persistent_memory", persistent_memory),
+    ) if v is not None}
 
 
 def build_mock_prepared_data(
@@ -73,18 +67,13 @@ def build_mock_prepared_data(
     calendar_event_id: Optional[str] = None
 ) -> Dict[str, Any]:
     """Build a mock prepared_data dict."""
-    data = {}
-    if meeting_id:
-        data["meeting_id"] = meeting_id
-    if client_id:
-        data["client_id"] = client_id
-    if client_name:
-        data["client_name"] = client_name
-    if target_date:
-        data["target_date"] = target_date
-    if calendar_event_id:
-        data["calendar_event_id"] = calendar_event_id
-    return data
+    return {k: v for k, v in (
+        ("meeting_id", meeting_id),
+        ("client_id", client_id),
+        ("client_name", client_name),
+        ("target_date", target_date),
+        ("calendar_event_id", calendar_event_id),
+    ) if v is not None}
 
 
 def build_mock_integration_data(
@@ -93,18 +82,61 @@ def build_mock_integration_data(
     structured_data: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """Build a mock integration_data dict."""
-    data = {}
-    if meeting_id:
-        data["meeting_id"] = meeting_id
-    if calendar_event:
-        data["calendar_event"] = calendar_event
-    if structured_data:
-        data["structured_data"] = structured_data
-    else:
-        data["structured_data"] = {}
+    data = {k: v for k, v in (
+        ("meeting_id", meeting_id),
+        ("calendar_event", calendar_event),
+    ) if v is not None}
+    data["structured_data"] = structured_data if structured_data is not None else {}
     return data
 
 
+def _freeze_integration_data(data: Dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap integration_data (and its nested dicts) in read-only proxies."""
+    return MappingProxyType({
+        key: MappingProxyType(value) if isinstance(value, dict) else value
+        for key, value in data.items()
+    })
+
+
+# Read-only integration_data for the common shapes, built once at import.
+# Only share these where integration_data is not mutated (e.g. prerequisite
+# checks); step execution updates structured_data in place, so call
+# build_mock_integration_data() there instead.
+EMPTY_INTEGRATION_DATA = _freeze_integration_data(build_mock_integration_data())
+INTEGRATION_DATA_WITH_MEETING = _freeze_integration_data(
+    build_mock_integration_data(meeting_id=123)
+)
+INTEGRATION_DATA_WITH_TRANSCRIPT = _freeze_integration_data(
+    build_mock_integration_data(
+        meeting_id=123,
+        structured_data={"transcript": "Test transcript"}
+    )
+)
+
+
+# Default scheduled_time for built meetings (datetimes are immutable, safe to share)
+_DEFAULT_MEETING_TIME = datetime(2024, 5, 1, 10, 0, 0)
+
+
+@dataclass(slots=True)
+class FakeMeeting:
+    """Plain stand-in for the Meeting model (no SQLAlchemy spec introspection)."""
+    id: int
+    title: str
+    scheduled_time: datetime
+    transcript: Optional[str] = None
+    summary: Optional[str] = None
+    client_id: Optional[int] = None
+    client: Any = None
+    attendees: Optional[str] = None
+    has_transcript: bool = False
+    recording_url: Optional[str] = None
+    calendar_event_id: Optional[str] = None
+    zoom_meeting_id: Optional[str] = None
+    status: Optional[str] = None
+    duration_minutes: Optional[int] = None
+
+
 def build_mock_meeting(
     id: int = 1,
     title: str = "Test Meeting",
@@ -113,18 +145,18 @@ def build_mock_meeting(
     summary: Optional[str] = None,
     client_id: Optional[int] = None,
     attendees: Optional[str] = None
-) -> MagicMock:
-    """Build a mock meeting object."""
-    meeting = MagicMock()
-    meeting.id = id
-    meeting.title = title
-    meeting.scheduled_time = date or datetime(2024, 5, 1, 10, 0, 0)
-    meeting.transcript = transcript
-    meeting.summary = summary
-    meeting.client_id = client_id
-    meeting.attendees = attendees
-    meeting.has_transcript = transcript is not None
-    return meeting
+) -> FakeMeeting:
+    """Build a fake meeting object."""
+    return FakeMeeting(
+        id=id,
+        title=title,
+        scheduled_time=date or _DEFAULT_MEETING_TIME,
+        transcript=transcript,
+        summary=summary,
+        client_id=client_id,
+        attendees=attendees,
+        has_transcript=transcript is not None
+    )
 
 
 def build_mock_calendar_event(
@@ -165,14 +197,17 @@ def build_mock_llm_response(
 
 
 def simulate_llm_call_sequence(call_sequence: List[Any]):
-    """Simulate a sequence of LLM calls."""
-    call_index = [0]
+    """Simulate a sequence of LLM calls (the last value repeats once exhausted).
+
+    An empty sequence builds fine and raises IndexError when called.
+    """
+    if not call_sequence:
+        def empty_side_effect(*args, **kwargs):
+            raise IndexError("simulate_llm_call_sequence: call_sequence is empty")
+        return empty_side_effect
+    responses = chain(call_sequence, repeat(call_sequence[-1]))
     def side_effect(*args, **kwargs):
-        if call_index[0] >= len(call_sequence):
-            return call_sequence[-1]  # Return last value if out of bounds
-        result = call_sequence[call_index[0]]
-        call_index[0] += 1
-        return result
+        return next(responses)
     return side_effect
 
 
@@ -1,10 +1,21 @@
 """Unit tests for last meeting auto-resolution."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from collections import namedtuple
+from datetime import datetime
+from unittest.mock import patch
 from app.orchestrator.last_meeting_resolver import resolve_last_meeting
 
 
+# Lightweight MeetingOption stand-in; the resolver only reads calendar_event_id
+MeetingOpt = namedtuple("MeetingOpt", ["calendar_event_id", "title"], defaults=[None])
+
+_TEST_TARGET_DATE = datetime(2024, 10, 29)
+
+# Event returned by the patched get_calendar_event_by_id (never mutated)
+CALENDAR_EVENT = {"id": "event_1", "summary": "Meeting 1"}
+
+
 class TestLastMeetingResolver:
     """Tests for resolve_last_meeting function."""
     
@@ -14,18 +25,16 @@ class TestLastMeetingResolver:
         intent = "summarization"
         target_date = None
         meeting_options = [
-            MagicMock(calendar_event_id="event_1", title="Meeting 1"),
-            MagicMock(calendar_event_id="event_2", title="Meeting 2"),
+            MeetingOpt("event_1", "Meeting 1"),
+            MeetingOpt("event_2", "Meeting 2"),
         ]
         
-        mock_calendar_event = {"id": "event_1", "summary": "Meeting 1"}
-        
         with patch('app.orchestrator.last_meeting_resolver.get_calendar_event_by_id') as mock_get:
-            mock_get.return_value = mock_calendar_event
+            mock_get.return_value = CALENDAR_EVENT
             
             result = resolve_last_meeting(message, intent, target_date, meeting_options)
             
-            assert result == mock_calendar_event
+            assert result == CALENDAR_EVENT
             mock_get.assert_called_once_with("event_1")
     
     def test_does_not_resolve_when_intent_not_summarization(self):
@@ -34,8 +43,8 @@ class TestLastMeetingResolver:
         intent = "meeting_brief"
         target_date = None
         meeting_options = [
-            MagicMock(calendar_event_id="event_1"),
-            MagicMock(calendar_event_id="event_2"),
+            MeetingOpt("event_1"),
+            MeetingOpt("event_2"),
         ]
         
         result = resolve_last_meeting(message, intent, target_date, meeting_options)
@@ -44,13 +53,12 @@ class TestLastMeetingResolver:
     
     def test_does_not_resolve_when_target_date_provided(self):
         """Test that resolver does not resolve when target_date is provided."""
-        from datetime import datetime
         message = "Summarize my last meeting"
         intent = "summarization"
-        target_date = datetime(2024, 10, 29)
+        target_date = _TEST_TARGET_DATE
         meeting_options = [
-            MagicMock(calendar_event_id="event_1"),
-            MagicMock(calendar_event_id="event_2"),
+            MeetingOpt("event_1"),
+            MeetingOpt("event_2"),
         ]
         
         result = resolve_last_meeting(message, intent, target_date, meeting_options)
@@ -63,7 +71,7 @@ class TestLastMeetingResolver:
         intent = "summarization"
         target_date = None
         meeting_options = [
-            MagicMock(calendar_event_id="event_1"),
+            MeetingOpt("event_1"),
         ]
         
         result = resolve_last_meeting(message, intent, target_date, meeting_options)
@@ -76,39 +84,49 @@ class TestLastMeetingResolver:
         intent = "summarization"
         target_date = None
         meeting_options = [
-            MagicMock(calendar_event_id="event_1"),
-            MagicMock(calendar_event_id="event_2"),
+            MeetingOpt("event_1"),
+            MeetingOpt("event_2"),
         ]
         
         result = resolve_last_meeting(message, intent, target_date, meeting_options)
         
         assert result is None
     
-    def test_resolves_with_different_recency_keywords(self):
+    @pytest.mark.parametrize("message,keyword", [
+        ("Summarize my last meeting", "last"),
+        ("Summarize my latest meeting", "latest"),
+        ("Summarize my most recent meeting", "most recent"),
+        ("Summarize my most-recent meeting", "most-recent"),
+    ])
+    def test_resolves_with_different_recency_keywords(self, message, keyword):
         """Test that resolver works with different recency keywords."""
-        test_cases = [
-            ("Summarize my last meeting", "last"),
-            ("Summarize my latest meeting", "latest"),
-            ("Summarize my most recent meeting", "most recent"),
-            ("Summarize my most-recent meeting", "most-recent"),
+        intent = "summarization"
+        target_date = None
+        meeting_options = [
+            MeetingOpt("event_1"),
+            MeetingOpt("event_2"),
         ]
         
-        for message, keyword in test_cases:
-            intent = "summarization"
-            target_date = None
-            meeting_options = [
-                MagicMock(calendar_event_id="event_1"),
-                MagicMock(calendar_event_id="event_2"),
-            ]
+        with patch('app.orchestrator.last_meeting_resolver.get_calendar_event_by_id') as mock_get:
+            mock_get.return_value = CALENDAR_EVENT
             
-            mock_calendar_event = {"id": "event_1", "summary": "Meeting 1"}
+            result = resolve_last_meeting(message, intent, target_date, meeting_options)
             
-            with patch('app.orchestrator.last_meeting_resolver.get_calendar_event_by_id') as mock_get:
-                mock_get.return_value = mock_calendar_event
-                
-                result = resolve_last_meeting(message, intent, target_date, meeting_options)
-                
-                assert result == mock_calendar_event, f"Failed for keyword: {keyword}"
+            assert result == CALENDAR_EVENT, f"Failed for keyword: {keyword}"
+    
+    def test_does_not_resolve_on_recency_substring(self):
+        """Test that recency keywords only match as whole words."""
+        message = "Summarize my meeting about the blast radius"
+        intent = "summarization"
+        target_date = None
+        meeting_options = [
+            MeetingOpt("event_1"),
+            MeetingOpt("event_2"),
+        ]
+        
+        result = resolve_last_meeting(message, intent, target_date, meeting_options)
+        
+        assert result is None
     
     def test_handles_dict_meeting_options(self):
         """Test that resolver handles MeetingOption as dict."""
@@ -120,14 +138,12 @@ class TestLastMeetingResolver:
             {"calendar_event_id": "event_2", "title": "Meeting 2"},
         ]
         
-        mock_calendar_event = {"id": "event_1", "summary": "Meeting 1"}
-        
         with patch('app.orchestrator.last_meeting_resolver.get_calendar_event_by_id') as mock_get:
-            mock_get.return_value = mock_calendar_event
+            mock_get.return_value = CALENDAR_EVENT
             
             result = resolve_last_meeting(message, intent, target_date, meeting_options)
             
-            assert result == mock_calendar_event
+            assert result == CALENDAR_EVENT
             mock_get.assert_called_once_with("event_1")
     
     def test_returns_none_when_calendar_event_id_missing(self):
@@ -136,8 +152,8 @@ class TestLastMeetingResolver:
         intent = "summarization"
         target_date = None
         meeting_options = [
-            MagicMock(calendar_event_id=None),  # Missing ID
-            MagicMock(calendar_event_id="event_2"),
+            MeetingOpt(None),  # Missing ID
+            MeetingOpt("event_2"),
         ]
         
         result = resolve_last_meeting(message, intent, target_date, meeting_options)
@@ -150,8 +166,8 @@ class TestLastMeetingResolver:
         intent = "summarization"
         target_date = None
         meeting_options = [
-            MagicMock(calendar_event_id="event_1"),
-            MagicMock(calendar_event_id="event_2"),
+            MeetingOpt("event_1"),
+            MeetingOpt("event_2"),
         ]
         
         with patch('app.orchestrator.last_meeting_resolver.get_calendar_event_by_id') as mock_get:
@@ -167,8 +183,8 @@ class TestLastMeetingResolver:
         intent = "summarization"
         target_date = None
         meeting_options = [
-            MagicMock(calendar_event_id="event_1"),
-            MagicMock(calendar_event_id="event_2"),
+            MeetingOpt("event_1"),
+            MeetingOpt("event_2"),
         ]
         
         with patch('app.orchestrator.last_meeting_resolver.get_calendar_event_by_id') as mock_get:
@@ -184,16 +200,14 @@ class TestLastMeetingResolver:
         intent = "summarization"
         target_date = None
         meeting_options = [
-            MagicMock(calendar_event_id="event_1"),
-            MagicMock(calendar_event_id="event_2"),
+            MeetingOpt("event_1"),
+            MeetingOpt("event_2"),
         ]
         
-        mock_calendar_event = {"id": "event_1", "summary": "Meeting 1"}
-        
         with patch('app.orchestrator.last_meeting_resolver.get_calendar_event_by_id') as mock_get:
-            mock_get.return_value = mock_calendar_event
+            mock_get.return_value = CALENDAR_EVENT
             
             result = resolve_last_meeting(message, intent, target_date, meeting_options)
             
-            assert result == mock_calendar_event
+            assert result == CALENDAR_EVENT
 
@@ -1,30 +1,4 @@
 import datetime
-import sys
-import types
-
-# Stub the calendar client module to avoid external dependencies during tests
-dummy_gc = types.ModuleType("app.integrations.google_calendar_client")
-
-
-def _noop(*args, **kwargs):
-    return None
-
-
-def _empty_list(*args, **kwargs):
-    return []
-
-
-def _is_event_in_past_stub(event, now):
-    return True
-
-
-dummy_gc.get_calendar_event_by_id = _noop
-dummy_gc.get_calendar_events_on_date = _empty_list
-dummy_gc.get_calendar_events_by_time_range = _empty_list
-dummy_gc.search_calendar_events_by_keyword = _empty_list
-dummy_gc._is_event_in_past = _is_event_in_past_stub
-
-sys.modules["app.integrations.google_calendar_client"] = dummy_gc
 
 from app.orchestrator.meeting_finder import MeetingFinder
 
@@ -50,16 +24,25 @@ class StubMemoryRepo:
         self.clients = clients or []
         self.meetings_by_client = meetings_by_client or {}
         self.meetings_by_user = meetings_by_user or {}
+        self._reindex()
+
+    def _reindex(self):
+        # lowercased name -> clients, for exact case-insensitive search
+        self._clients_by_lc = {}
+        for c in self.clients:
+            self._clients_by_lc.setdefault(c.name.lower(), []).append(c)
+        # id -> meeting; client buckets take precedence, as in the original scan
+        self._by_id = {}
+        for bucket in (self.meetings_by_client, self.meetings_by_user):
+            for meetings in bucket.values():
+                for m in meetings:
+                    self._by_id.setdefault(m.id, m)
 
     def get_meeting_by_id(self, meeting_id):
-        for meetings in list(self.meetings_by_client.values()) + list(self.meetings_by_user.values()):
-            for m in meetings:
-                if m.id == meeting_id:
-                    return m
-        return None
+        return self._by_id.get(meeting_id)
 
     def search_clients_by_name(self, name, user_id=None):
-        return [c for c in self.clients if c.name.lower() == name.lower()]
+        return list(self._clients_by_lc.get(name.lower(), ()))
 
     def get_meetings_by_client(self, client_id, limit=None):
         meetings = self.meetings_by_client.get(client_id, [])
@@ -74,15 +57,23 @@ def make_dt(year, month, day):
     return datetime.datetime(year, month, day, 10, 0, 0, tzinfo=datetime.timezone.utc)
 
 
+# Fixed meeting times used below (datetimes are immutable, safe to share)
+DT_2024_09_01 = make_dt(2024, 9, 1)
+DT_2024_10_01 = make_dt(2024, 10, 1)
+DT_2024_10_05 = make_dt(2024, 10, 5)
+DT_2024_10_15 = make_dt(2024, 10, 15)
+DT_2024_10_29 = make_dt(2024, 10, 29)
+
+
 def test_client_date_no_match_returns_none():
     # MTCA client exists but no meetings on target date
     client = StubClient(1, "MTCA")
     memory = StubMemoryRepo(
         clients=[client],
-        meetings_by_client={1: [StubMeeting(10, "MTCA Past", make_dt(2024, 10, 15))]},
+        meetings_by_client={1: [StubMeeting(10, "MTCA Past", DT_2024_10_15)]},
     )
     finder = MeetingFinder(db=None, memory=memory)
-    target_date = make_dt(2024, 10, 29)
+    target_date = DT_2024_10_29
 
     result = finder.find_meeting_in_database(
         client_name="MTCA",
@@ -95,13 +86,13 @@ def test_client_date_no_match_returns_none():
 
 def test_client_date_exact_match_returns_meeting():
     client = StubClient(1, "MTCA")
-    mtca_meeting = StubMeeting(20, "MTCA Oct 29", make_dt(2024, 10, 29))
+    mtca_meeting = StubMeeting(20, "MTCA Oct 29", DT_2024_10_29)
     memory = StubMemoryRepo(
         clients=[client],
         meetings_by_client={1: [mtca_meeting]},
     )
     finder = MeetingFinder(db=None, memory=memory)
-    target_date = make_dt(2024, 10, 29)
+    target_date = DT_2024_10_29
 
     result = finder.find_meeting_in_database(
         client_name="MTCA",
@@ -114,8 +105,8 @@ def test_client_date_exact_match_returns_meeting():
 
 def test_client_without_date_returns_most_recent():
     client = StubClient(1, "MTCA")
-    old_meeting = StubMeeting(30, "MTCA Old", make_dt(2024, 9, 1))
-    recent_meeting = StubMeeting(31, "MTCA Recent", make_dt(2024, 10, 1))
+    old_meeting = StubMeeting(30, "MTCA Old", DT_2024_09_01)
+    recent_meeting = StubMeeting(31, "MTCA Recent", DT_2024_10_01)
     memory = StubMemoryRepo(
         clients=[client],
         meetings_by_client={1: [old_meeting, recent_meeting]},
@@ -132,7 +123,7 @@ def test_client_without_date_returns_most_recent():
 
 
 def test_user_fallback_only_when_no_client():
-    user_meeting = StubMeeting(40, "User Recent", make_dt(2024, 10, 5))
+    user_meeting = StubMeeting(40, "User Recent", DT_2024_10_05)
     memory = StubMemoryRepo(
         clients=[],
         meetings_by_user={123: [user_meeting]},
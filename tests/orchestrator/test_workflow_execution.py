@@ -1,12 +1,14 @@
 """Tests for workflow execution and validation."""
 
 import pytest
+from functools import partial
 from unittest.mock import MagicMock
 import sys
 from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from app.orchestrator.tool_execution import is_valid_step
 from tests.integrations.test_integration_mocks import (
     build_mock_workflow,
     build_mock_step,
@@ -14,42 +16,119 @@ from tests.integrations.test_integration_mocks import (
 )
 
 
+@pytest.fixture
+def run_unsupported_intent(run_executor):
+    """run_executor for an intent with no legacy handler, so only the workflow path can answer."""
+    return partial(run_executor, intent="unsupported_intent")
+
+
+# Workflows for the parsing tests (rebuilt per test so no test sees another's edits).
+@pytest.fixture
+def valid_two_step_workflow():
+    """Two-step workflow with required_data."""
+    return build_mock_workflow(
+        steps=[
+            build_mock_step("find_meeting", "meeting_finder"),
+            build_mock_step("summarize", "summarization")
+        ],
+        required_data=["meeting_id"]
+    )
+
+
+@pytest.fixture
+def nested_fallback_workflow():
+    """Single step whose fallback is a list of two fallbacks."""
+    return build_mock_workflow(
+        steps=[
+            build_mock_step(
+                "find_meeting",
+                "meeting_finder",
+                fallback=[
+                    build_mock_fallback(
+                        "resolve_meeting_from_calendar",
+                        conditions=["no_db_match"]
+                    ),
+                    build_mock_fallback(
+                        "use_last_selected_meeting",
+                        conditions=["no_db_match"]
+                    )
+                ]
+            )
+        ]
+    )
+
+
+@pytest.fixture
+def dict_fallback_workflow():
+    """Single step whose fallback is a single dict."""
+    return build_mock_workflow(
+        steps=[
+            build_mock_step(
+                "find_meeting",
+                "meeting_finder",
+                fallback=build_mock_fallback(
+                    "resolve_meeting_from_calendar",
+                    conditions=["no_db_match"]
+                )
+            )
+        ]
+    )
+
+
+@pytest.fixture
+def empty_steps_workflow():
+    """Workflow with an empty steps list."""
+    return build_mock_workflow(steps=[])
+
+
+@pytest.fixture
+def no_required_data_workflow():
+    """Single-step workflow without required_data."""
+    return build_mock_workflow(
+        steps=[build_mock_step("find_meeting", "meeting_finder")]
+    )
+
+
+@pytest.fixture
+def prerequisites_workflow():
+    """Single step declaring prerequisites."""
+    return build_mock_workflow(
+        steps=[
+            build_mock_step(
+                "summarize",
+                "summarization",
+                prerequisites=["transcript", "meeting_id"]
+            )
+        ]
+    )
+
+
 class TestWorkflowExecution:
     """Tests for workflow parsing and validation."""
     
-    def test_workflow_parsing_valid_structure(self, tool_executor):
+    def test_workflow_parsing_valid_structure(self, tool_executor, valid_two_step_workflow):
         """Test that valid workflow structure is parsed correctly."""
-        # Arrange
-        workflow = build_mock_workflow(
-            steps=[
-                build_mock_step("find_meeting", "meeting_finder"),
-                build_mock_step("summarize", "summarization")
-            ],
-            required_data=["meeting_id"]
-        )
-        
         # Act - Just verify structure is valid
-        assert workflow is not None
-        assert "steps" in workflow
-        assert isinstance(workflow["steps"], list)
-        assert len(workflow["steps"]) == 2
-        assert "required_data" in workflow
-        assert isinstance(workflow["required_data"], list)
+        assert valid_two_step_workflow is not None
+        assert "steps" in valid_two_step_workflow
+        assert isinstance(valid_two_step_workflow["steps"], list)
+        assert len(valid_two_step_workflow["steps"]) == 2
+        assert "required_data" in valid_two_step_workflow
+        assert isinstance(valid_two_step_workflow["required_data"], list)
     
-    def test_workflow_parsing_malformed_workflow(self, tool_executor):
-        """Test that malformed workflows are handled gracefully."""
-        # Arrange - Invalid workflow structures
-        invalid_workflows = [
-            {"invalid": "structure"},  # Missing steps
-            {"steps": "not_a_list"},  # Steps not a list
-            {"steps": None},  # Steps is None
-            {},  # Empty dict
-        ]
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("invalid_workflow", [
+        pytest.param({"invalid": "structure"}, id="missing_steps"),
+        pytest.param({"steps": "not_a_list"}, id="steps_not_a_list"),
+        pytest.param({"steps": None}, id="steps_none"),
+        pytest.param({}, id="empty_dict"),
+    ])
+    async def test_workflow_parsing_malformed_workflow(self, run_unsupported_intent, invalid_workflow):
+        """Test that malformed workflows fall back to legacy routing without raising."""
+        result = await run_unsupported_intent(invalid_workflow)
         
-        for invalid_workflow in invalid_workflows:
-            # Act - Should not raise exception
-            # The executor should handle invalid workflows gracefully
-            assert isinstance(invalid_workflow, dict)
+        # Unknown intent on the legacy path returns None (no workflow error)
+        assert result is None
     
     def test_workflow_parsing_missing_step_fields(self, tool_executor):
         """Test that steps with missing fields are filtered out."""
@@ -66,23 +145,22 @@ class TestWorkflowExecution:
         # Act - Verify structure
         assert len(workflow["steps"]) == 4
         # Valid steps should have both action and tool
-        valid_steps = [s for s in workflow["steps"] if s.get("action") and s.get("tool")]
+        valid_steps = [s for s in workflow["steps"] if is_valid_step(s)]
         assert len(valid_steps) == 1
     
-    def test_workflow_parsing_non_list_steps(self, tool_executor):
-        """Test that non-list steps arrays are handled."""
-        # Arrange
-        invalid_workflows = [
-            {"steps": "string"},
-            {"steps": 123},
-            {"steps": None},
-            {"steps": {}},
-        ]
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("invalid_workflow", [
+        pytest.param({"steps": "string"}, id="string"),
+        pytest.param({"steps": 123}, id="int"),
+        pytest.param({"steps": None}, id="none"),
+        pytest.param({"steps": {}}, id="dict"),
+    ])
+    async def test_workflow_parsing_non_list_steps(self, run_unsupported_intent, invalid_workflow):
+        """Test that non-list steps arrays are not executed as a plan."""
+        result = await run_unsupported_intent(invalid_workflow)
         
-        for invalid_workflow in invalid_workflows:
-            # Act - Should not raise exception
-            assert isinstance(invalid_workflow, dict)
-            # Steps should be validated as list in executor
+        # Steps are validated as a list in the executor; otherwise legacy routing applies
+        assert result is None
     
     def test_workflow_parsing_steps_with_invalid_types(self, tool_executor):
         """Test that steps with invalid types are filtered."""
@@ -100,99 +178,43 @@ class TestWorkflowExecution:
         # Act - Verify structure
         assert len(workflow["steps"]) == 5
         # Only dict steps with action and tool should be valid
-        valid_steps = [
-            s for s in workflow["steps"]
-            if isinstance(s, dict) and s.get("action") and s.get("tool")
-        ]
+        valid_steps = [s for s in workflow["steps"] if is_valid_step(s)]
         assert len(valid_steps) == 2
     
-    def test_workflow_parsing_nested_fallback_structures(self, tool_executor):
+    def test_workflow_parsing_nested_fallback_structures(self, tool_executor, nested_fallback_workflow):
         """Test that nested fallback structures are handled."""
-        # Arrange
-        workflow = build_mock_workflow(
-            steps=[
-                build_mock_step(
-                    "find_meeting",
-                    "meeting_finder",
-                    fallback=[
-                        build_mock_fallback(
-                            "resolve_meeting_from_calendar",
-                            conditions=["no_db_match"]
-                        ),
-                        build_mock_fallback(
-                            "use_last_selected_meeting",
-                            conditions=["no_db_match"]
-                        )
-                    ]
-                )
-            ]
-        )
-        
         # Act - Verify structure
-        assert len(workflow["steps"]) == 1
-        step = workflow["steps"][0]
+        assert len(nested_fallback_workflow["steps"]) == 1
+        step = nested_fallback_workflow["steps"][0]
         assert "fallback" in step
         assert isinstance(step["fallback"], list)
         assert len(step["fallback"]) == 2
     
-    def test_workflow_parsing_fallback_as_dict(self, tool_executor):
+    def test_workflow_parsing_fallback_as_dict(self, tool_executor, dict_fallback_workflow):
         """Test that fallback can be a single dict."""
-        # Arrange
-        workflow = build_mock_workflow(
-            steps=[
-                build_mock_step(
-                    "find_meeting",
-                    "meeting_finder",
-                    fallback=build_mock_fallback(
-                        "resolve_meeting_from_calendar",
-                        conditions=["no_db_match"]
-                    )
-                )
-            ]
-        )
-        
         # Act - Verify structure
-        assert len(workflow["steps"]) == 1
-        step = workflow["steps"][0]
+        assert len(dict_fallback_workflow["steps"]) == 1
+        step = dict_fallback_workflow["steps"][0]
         assert "fallback" in step
         assert isinstance(step["fallback"], dict)
         assert step["fallback"]["action"] == "resolve_meeting_from_calendar"
     
-    def test_workflow_parsing_empty_steps(self, tool_executor):
+    def test_workflow_parsing_empty_steps(self, tool_executor, empty_steps_workflow):
         """Test that empty steps array is handled."""
-        # Arrange
-        workflow = build_mock_workflow(steps=[])
-        
         # Act - Verify structure
-        assert workflow["steps"] == []
-        assert isinstance(workflow["steps"], list)
+        assert empty_steps_workflow["steps"] == []
+        assert isinstance(empty_steps_workflow["steps"], list)
     
-    def test_workflow_parsing_missing_required_data(self, tool_executor):
+    def test_workflow_parsing_missing_required_data(self, tool_executor, no_required_data_workflow):
         """Test that missing required_data is handled."""
-        # Arrange
-        workflow = build_mock_workflow(
-            steps=[build_mock_step("find_meeting", "meeting_finder")]
-        )
-        
         # Act - Verify structure
-        assert "required_data" not in workflow or workflow.get("required_data") is None
+        assert no_required_data_workflow.get("required_data") is None
     
-    def test_workflow_parsing_prerequisites_in_step(self, tool_executor):
+    def test_workflow_parsing_prerequisites_in_step(self, tool_executor, prerequisites_workflow):
         """Test that prerequisites can be defined in steps."""
-        # Arrange
-        workflow = build_mock_workflow(
-            steps=[
-                build_mock_step(
-                    "summarize",
-                    "summarization",
-                    prerequisites=["transcript", "meeting_id"]
-                )
-            ]
-        )
-        
         # Act - Verify structure
-        assert len(workflow["steps"]) == 1
-        step = workflow["steps"][0]
+        assert len(prerequisites_workflow["steps"]) == 1
+        step = prerequisites_workflow["steps"][0]
         assert "prerequisites" in step
         assert isinstance(step["prerequisites"], list)
         assert len(step["prerequisites"]) == 2
@@ -3,24 +3,33 @@
 import pytest
 from unittest.mock import MagicMock
 from app.tools.followup import FollowUpTool
-from app.llm.gemini_client import GeminiClient
+
+
+class _FakeLLM:
+    """Minimal LLM client stand-in: FollowUpTool only calls llm_chat (sync)."""
+    
+    def __init__(self):
+        self.llm_chat = MagicMock()
 
 
 class TestFollowUpTool:
     """Tests for FollowUpTool.generate_followup()."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_llm_client(self):
-        """Create a mock LLM client."""
-        client = MagicMock(spec=GeminiClient)
-        client.llm_chat = MagicMock()  # llm_chat is not async
-        return client
+        """Create a mock LLM client (shared across the module, reset per test)."""
+        return _FakeLLM()
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def followup_tool(self, mock_llm_client):
         """Create a FollowUpTool instance with mocked LLM."""
         return FollowUpTool(mock_llm_client)
     
+    @pytest.fixture(autouse=True)
+    def _reset_llm_client(self, mock_llm_client):
+        """Clear calls, return values and side effects left by a previous test."""
+        mock_llm_client.llm_chat.reset_mock(return_value=True, side_effect=True)
+    
     @pytest.mark.asyncio
     async def test_generate_followup_with_full_data(self, followup_tool, mock_llm_client):
         """Test follow-up generation with all fields provided."""
@@ -1,115 +1,144 @@
 """Tests for calendar utility functions."""
 
 import pytest
-from datetime import datetime, timezone
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from app.utils import calendar_utils
 from app.utils.calendar_utils import (
     extract_attendees,
     sort_events_by_date
 )
 
 
+def _build_shuffled_events(count: int, seed: int = 42):
+    """Build `count` hourly events (ids in chronological order), shuffled deterministically."""
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    events = [
+        {'id': i, 'start': {'dateTime': (base + timedelta(hours=i)).isoformat().replace('+00:00', 'Z')}}
+        for i in range(count)
+    ]
+    return random.Random(seed).sample(events, count)
+
+
+# 1000 events in a known shuffled order, built once for the large-input sort test
+_SHUFFLED_EVENTS = _build_shuffled_events(1000)
+
+
 class TestExtractAttendees:
     """Tests for extract_attendees() function."""
     
-    def test_handles_attendees_with_displayname(self):
-        """Test extracting attendees with displayName."""
-        event = {
-            'attendees': [
+    @pytest.mark.parametrize("event,expected_substrings,exact", [
+        # displayName used when present
+        pytest.param(
+            {'attendees': [
                 {'displayName': 'John Doe', 'email': 'john@example.com'},
                 {'displayName': 'Jane Smith', 'email': 'jane@example.com'}
-            ]
-        }
-        result = extract_attendees(event)
-        assert result == "John Doe, Jane Smith"
-    
-    def test_falls_back_to_email(self):
-        """Test that email is used when displayName is missing."""
-        event = {
-            'attendees': [
+            ]},
+            [], "John Doe, Jane Smith",
+            id="displayname",
+        ),
+        # email used when displayName is missing
+        pytest.param(
+            {'attendees': [
                 {'email': 'john@example.com'},
                 {'displayName': 'Jane Smith', 'email': 'jane@example.com'}
-            ]
-        }
-        result = extract_attendees(event)
-        assert 'john@example.com' in result
-        assert 'Jane Smith' in result
-    
-    def test_returns_not_specified_when_empty(self):
-        """Test that empty attendees list returns 'Not specified'."""
-        event = {'attendees': []}
-        result = extract_attendees(event)
-        assert result == "Not specified"
-    
-    def test_returns_not_specified_when_no_attendees_field(self):
-        """Test that missing attendees field returns 'Not specified'."""
-        event = {}
-        result = extract_attendees(event)
-        assert result == "Not specified"
-    
-    def test_returns_not_specified_for_none_event(self):
-        """Test that None event returns 'Not specified'."""
-        result = extract_attendees(None)
-        assert result == "Not specified"
-    
-    def test_handles_attendees_without_name_or_email(self):
-        """Test that attendees without name or email are skipped."""
-        event = {
-            'attendees': [
+            ]},
+            ['john@example.com', 'Jane Smith'], None,
+            id="falls_back_to_email",
+        ),
+        pytest.param({'attendees': []}, [], "Not specified", id="empty_attendees"),
+        pytest.param({}, [], "Not specified", id="no_attendees_field"),
+        pytest.param(None, [], "Not specified", id="none_event"),
+        # attendees without name or email are skipped
+        pytest.param(
+            {'attendees': [
                 {'displayName': 'John Doe'},
                 {},  # Empty attendee
                 {'email': 'jane@example.com'}
-            ]
-        }
-        result = extract_attendees(event)
-        assert 'John Doe' in result
-        assert 'jane@example.com' in result
-        # Should not have empty strings
-    
-    def test_handles_mixed_attendees(self):
-        """Test handling mix of displayName and email-only attendees."""
-        event = {
-            'attendees': [
+            ]},
+            ['John Doe', 'jane@example.com'], None,
+            id="skips_without_name_or_email",
+        ),
+        # mix of displayName and email-only attendees
+        pytest.param(
+            {'attendees': [
                 {'displayName': 'John Doe'},
                 {'email': 'jane@example.com'},
                 {'displayName': 'Bob Smith', 'email': 'bob@example.com'}
-            ]
-        }
+            ]},
+            ['John Doe', 'jane@example.com', 'Bob Smith'], None,
+            id="mixed_attendees",
+        ),
+    ])
+    def test_extract_attendees(self, event, expected_substrings, exact):
+        """Test extract_attendees output (exact string, or expected names/emails present)."""
         result = extract_attendees(event)
-        assert 'John Doe' in result
-        assert 'jane@example.com' in result
-        assert 'Bob Smith' in result
+        if exact is not None:
+            assert result == exact
+        for substring in expected_substrings:
+            assert substring in result
 
 
 class TestSortEventsByDate:
     """Tests for sort_events_by_date() function."""
     
-    def test_correctly_sorts_events_newest_to_oldest(self):
-        """Test that events are sorted newest first (reverse=True)."""
-        events = [
-            {'start': {'dateTime': '2024-01-01T10:00:00Z'}},
-            {'start': {'dateTime': '2024-03-01T10:00:00Z'}},
-            {'start': {'dateTime': '2024-02-01T10:00:00Z'}}
-        ]
-        result = sort_events_by_date(events, reverse=True)
-        
-        assert len(result) == 3
-        assert result[0]['start']['dateTime'] == '2024-03-01T10:00:00Z'
-        assert result[1]['start']['dateTime'] == '2024-02-01T10:00:00Z'
-        assert result[2]['start']['dateTime'] == '2024-01-01T10:00:00Z'
-    
-    def test_sorts_oldest_to_newest_when_reverse_false(self):
-        """Test that events are sorted oldest first when reverse=False."""
-        events = [
-            {'start': {'dateTime': '2024-03-01T10:00:00Z'}},
-            {'start': {'dateTime': '2024-01-01T10:00:00Z'}},
-            {'start': {'dateTime': '2024-02-01T10:00:00Z'}}
-        ]
-        result = sort_events_by_date(events, reverse=False)
+    # (events, reverse, expected order as indices into events)
+    @pytest.mark.parametrize("events,reverse,expected_order", [
+        pytest.param(
+            [
+                {'start': {'dateTime': '2024-01-01T10:00:00Z'}},
+                {'start': {'dateTime': '2024-03-01T10:00:00Z'}},
+                {'start': {'dateTime': '2024-02-01T10:00:00Z'}}
+            ],
+            True, [1, 2, 0],
+            id="newest_to_oldest",
+        ),
+        pytest.param(
+            [
+                {'start': {'dateTime': '2024-03-01T10:00:00Z'}},
+                {'start': {'dateTime': '2024-01-01T10:00:00Z'}},
+                {'start': {'dateTime': '2024-02-01T10:00:00Z'}}
+            ],
+            False, [1, 2, 0],
+            id="oldest_to_newest_when_reverse_false",
+        ),
+        # Same timestamps keep their original order (sorted() is stable)
+        pytest.param(
+            [
+                {'id': '1', 'start': {'dateTime': '2024-01-01T10:00:00Z'}},
+                {'id': '2', 'start': {'dateTime': '2024-01-01T10:00:00Z'}},
+                {'id': '3', 'start': {'dateTime': '2024-01-01T10:00:00Z'}}
+            ],
+            True, [0, 1, 2],
+            id="stable_same_timestamps",
+        ),
+        pytest.param([], True, [], id="empty_list"),
+        # All-day events
+        pytest.param(
+            [
+                {'start': {'date': '2024-03-01'}},
+                {'start': {'date': '2024-01-01'}},
+                {'start': {'date': '2024-02-01'}}
+            ],
+            True, [0, 2, 1],
+            id="date_only_events",
+        ),
+        pytest.param(
+            [
+                {'start': {'date': '2024-01-01'}},
+                {'start': {'dateTime': '2024-02-01T10:00:00Z'}},
+                {'start': {'date': '2024-03-01'}}
+            ],
+            True, [2, 1, 0],
+            id="mixed_datetime_and_date",
+        ),
+    ])
+    def test_sorts_events(self, events, reverse, expected_order):
+        """Test that events are sorted by start date in the requested direction."""
+        result = sort_events_by_date(events, reverse=reverse)
         
-        assert len(result) == 3
-        assert result[0]['start']['dateTime'] == '2024-01-01T10:00:00Z'
-        assert result[1]['start']['dateTime'] == '2024-02-01T10:00:00Z'
-        assert result[2]['start']['dateTime'] == '2024-03-01T10:00:00Z'
+        assert result == [events[i] for i in expected_order]
     
     def test_handles_events_missing_dates(self):
         """Test that events without dates are placed at the end."""
@@ -129,53 +158,17 @@ class TestSortEventsByDate:
         assert 'dateTime' not in result[2].get('start', {})
         assert 'start' not in result[3] or 'dateTime' not in result[3].get('start', {})
     
-    def test_ensures_stable_sorting_same_timestamps(self):
-        """Test that events with same timestamps maintain stable order."""
-        events = [
-            {'id': '1', 'start': {'dateTime': '2024-01-01T10:00:00Z'}},
-            {'id': '2', 'start': {'dateTime': '2024-01-01T10:00:00Z'}},
-            {'id': '3', 'start': {'dateTime': '2024-01-01T10:00:00Z'}}
-        ]
-        result = sort_events_by_date(events, reverse=True)
-        
-        # All have same timestamp, so order should be preserved (stable sort)
-        assert len(result) == 3
-        # Python's sorted() is stable, so original order should be maintained
-        # for items with equal keys
-        ids = [event['id'] for event in result]
-        assert ids == ['1', '2', '3']
-    
-    def test_handles_empty_list(self):
-        """Test that empty list returns empty list."""
-        result = sort_events_by_date([], reverse=True)
-        assert result == []
-    
-    def test_handles_date_only_events(self):
-        """Test sorting events with date-only (all-day events)."""
-        events = [
-            {'start': {'date': '2024-03-01'}},
-            {'start': {'date': '2024-01-01'}},
-            {'start': {'date': '2024-02-01'}}
-        ]
-        result = sort_events_by_date(events, reverse=True)
-        
-        assert len(result) == 3
-        assert result[0]['start']['date'] == '2024-03-01'
-        assert result[1]['start']['date'] == '2024-02-01'
-        assert result[2]['start']['date'] == '2024-01-01'
-    
-    def test_handles_mixed_datetime_and_date(self):
-        """Test sorting events with both dateTime and date fields."""
-        events = [
-            {'start': {'date': '2024-01-01'}},
-            {'start': {'dateTime': '2024-02-01T10:00:00Z'}},
-            {'start': {'date': '2024-03-01'}}
-        ]
-        result = sort_events_by_date(events, reverse=True)
+    @pytest.mark.parametrize("reverse", [True, False], ids=["newest_first", "oldest_first"])
+    def test_sorts_large_shuffled_input_with_linear_key_extraction(self, reverse):
+        """Test sort correctness on 1000 shuffled events and that dates are extracted O(n) times."""
+        events = list(_SHUFFLED_EVENTS)
+        with patch.object(
+            calendar_utils,
+            "extract_event_datetime",
+            wraps=calendar_utils.extract_event_datetime
+        ) as extract:
+            result = sort_events_by_date(events, reverse=reverse)
         
-        assert len(result) == 3
-        # dateTime events should be sorted correctly
-        assert result[0]['start']['date'] == '2024-03-01'
-        assert result[1]['start']['dateTime'] == '2024-02-01T10:00:00Z'
-        assert result[2]['start']['date'] == '2024-01-01'
-
+        expected_ids = sorted(range(len(events)), reverse=reverse)
+        assert [event['id'] for event in result] == expected_ids
+        assert extract.call_count <= 2 * len(events)
@@ -1,11 +1,18 @@
 """Tests for date utility functions."""
 
 import pytest
-from datetime import datetime, timezone
+import random
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from app.utils.date_utils import (
+    clear_parse_iso_datetime_cache,
     parse_iso_datetime,
+    parse_iso_datetimes,
     format_datetime_display,
-    extract_event_datetime
+    extract_event_datetime,
+    extract_event_datetimes
 )
 
 
@@ -75,13 +82,105 @@ class TestParseIsoDatetime:
         result = parse_iso_datetime("2024-05-01T10:00:00+00:00")
         assert result is not None
         assert result.tzinfo == timezone.utc
-    
+
+    def test_converts_short_strings_with_offsets(self):
+        """Test that 19/20-char strings carrying an offset are converted, not relabelled."""
+        result = parse_iso_datetime("2024-05-01T10+05:00")
+        assert result == datetime(2024, 5, 1, 5, 0, tzinfo=timezone.utc)
+
+        # Offset followed by a stray "Z" is not valid ISO
+        assert parse_iso_datetime("2024-05-01T10+05:00Z") is None
+
+    def test_shape_precheck_keeps_other_iso_forms(self):
+        """Test that the shape pre-check rejects junk without narrowing accepted ISO forms."""
+        expected = datetime(2024, 5, 1, tzinfo=timezone.utc)
+        assert parse_iso_datetime("20240501") == expected
+        assert parse_iso_datetime("2024-W18-3") == expected
+        assert parse_iso_datetime("not-a-date") is None
+        assert parse_iso_datetime(12345) is None
+
     def test_custom_default_timezone(self):
         """Test with custom default timezone."""
         custom_tz = timezone.utc
         result = parse_iso_datetime("2024-05-01T10:00:00", default_tz=custom_tz)
         assert result is not None
         assert result.tzinfo == custom_tz
+    
+    def test_reuses_cached_result_for_repeated_strings(self):
+        """Test that repeated parses of the same string return the memoized datetime."""
+        clear_parse_iso_datetime_cache()
+        first = parse_iso_datetime("2024-05-01T10:00:00Z")
+        second = parse_iso_datetime("2024-05-01T10:00:00Z")
+        assert first is second
+        
+        clear_parse_iso_datetime_cache()
+        third = parse_iso_datetime("2024-05-01T10:00:00Z")
+        assert third == first
+        assert third is not first
+    
+    def test_batch_parse_matches_single_parse(self):
+        """Test that parse_iso_datetimes parses element-wise, preserving order and failures."""
+        date_strs = [
+            "2024-05-01T10:00:00Z",
+            "2024-05-01",
+            "invalid",
+            None,
+            "2024-05-01T10:00:00-05:00",
+        ]
+        results = parse_iso_datetimes(date_strs)
+        assert results == [parse_iso_datetime(date_str) for date_str in date_strs]
+        assert results[2] is None
+        assert results[3] is None
+        assert parse_iso_datetimes([]) == []
+
+
+def _generate_iso_corpus(count, seed=20241121):
+    """Deterministic ISO strings covering every parse path: date-only, naive, "Z", offsets, fractions."""
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(count):
+        dt = datetime(2000, 1, 1) + timedelta(
+            days=rng.randrange(366 * 40), seconds=rng.randrange(86400)
+        )
+        shape = i % 6
+        if shape == 0:
+            corpus.append(dt.date().isoformat())
+        elif shape == 1:
+            corpus.append(dt.isoformat())
+        elif shape == 2:
+            corpus.append(dt.isoformat(sep=" "))
+        elif shape == 3:
+            corpus.append(dt.isoformat() + "Z")
+        elif shape == 4:
+            offset = timezone(timedelta(minutes=rng.randrange(-14 * 60, 14 * 60 + 1, 15)))
+            corpus.append(dt.replace(tzinfo=offset).isoformat())
+        else:
+            micro = dt.replace(microsecond=rng.randrange(1, 1000000))
+            corpus.append(micro.isoformat(timespec=rng.choice(("milliseconds", "microseconds"))) + "Z")
+    return corpus
+
+
+ISO_CORPUS = _generate_iso_corpus(100)
+
+
+class TestParseIsoDatetimeFastPath:
+    """Pins the length-dispatched fast paths to datetime.fromisoformat results."""
+    
+    @pytest.mark.parametrize("date_str", ISO_CORPUS)
+    @pytest.mark.parametrize(
+        "default_tz",
+        [timezone.utc, timezone(timedelta(hours=-5))],
+        ids=["utc", "utc-5"]
+    )
+    def test_matches_fromisoformat(self, date_str, default_tz):
+        """Test that parse_iso_datetime agrees with fromisoformat (naive values take default_tz)."""
+        expected = datetime.fromisoformat(date_str)
+        if expected.tzinfo is None:
+            expected = expected.replace(tzinfo=default_tz)
+        
+        result = parse_iso_datetime(date_str, default_tz)
+        assert result == expected
+        assert result.utcoffset() == default_tz.utcoffset(None)
 
 
 class TestFormatDatetimeDisplay:
@@ -191,4 +290,34 @@ class TestExtractEventDatetime:
         assert result is not None
         assert result.day == 1  # Should use dateTime, not date
         assert result.hour == 10  # Should have time component
+    
+    def test_batch_extract_matches_single_extract(self):
+        """Test that extract_event_datetimes extracts element-wise, preserving order and failures."""
+        events = [
+            {'start': {'dateTime': '2024-05-01T10:00:00Z'}},
+            {'start': {'date': '2024-05-02'}},
+            {'start': {'dateTime': '', 'date': '2024-05-03'}},
+            {'start': {'dateTime': 'invalid'}},
+            {'start': {}},
+            {},
+            None,
+        ]
+        results = extract_event_datetimes(events)
+        assert results == [extract_event_datetime(event) for event in events]
+        assert [r.day if r else None for r in results] == [1, 2, 3, None, None, None, None]
+        assert extract_event_datetimes([]) == []
+
 
+def test_date_utils_does_not_import_dateutil():
+    """Test that importing date_utils stays stdlib-only (no dateutil at import time)."""
+    # Fresh interpreter: other tests in the session may have imported dateutil already
+    result = subprocess.run(
+        [
+            sys.executable, "-c",
+            "import sys, app.utils.date_utils; sys.exit('dateutil' in sys.modules)"
+        ],
+        cwd=Path(__file__).parent.parent.parent,
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, result.stderr